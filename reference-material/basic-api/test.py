@@ -1,18 +1,119 @@
-import requests
+import asyncio
+import importlib.util
+import sqlite3
+import time
+from pathlib import Path
 
-orcid_id = "0000-0003-1574-0784" 
-url = f"https://pub.orcid.org/v3.0/{orcid_id}"
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# HTTP/2 multiplexa as requisições numa só conexão; precisa do extra httpx[http2]
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+BASE_URL = "https://pub.orcid.org/v3.0"
 
 headers = {
     "Accept": "application/json"
 }
 
-response = requests.get(url, headers=headers)
+# Máximo de requisições simultâneas ao ORCID no modo assíncrono
+MAX_CONCURRENT_REQUESTS = 20
+
+
+def parse_json(response):
+    # orjson (em C) é bem mais rápido que o json padrão usado por response.json()
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+# Registros públicos mudam pouco: respostas ficam em cache por 24h, num
+# arquivo SQLite ao lado do script para sobreviver entre execuções
+CACHE_TTL_SECONDS = 86400
+CACHE_PATH = Path(__file__).with_name("orcid_cache.sqlite3")
+
+
+def _normalize_orcid(orcid_id):
+    return orcid_id.strip().upper()
+
+
+def _open_cache():
+    db = sqlite3.connect(CACHE_PATH)
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS orcid_cache ("
+        "orcid_id TEXT PRIMARY KEY, fetched_at REAL NOT NULL, etag TEXT, body BLOB NOT NULL)"
+    )
+    return db
+
+
+def _cache_get(db, orcid_id):
+    return db.execute(
+        "SELECT fetched_at, etag, body FROM orcid_cache WHERE orcid_id = ?", (orcid_id,)
+    ).fetchone()
+
+
+def _cache_put(db, orcid_id, etag, body):
+    db.execute(
+        "INSERT OR REPLACE INTO orcid_cache (orcid_id, fetched_at, etag, body) VALUES (?, ?, ?, ?)",
+        (orcid_id, time.time(), etag, body),
+    )
+
+
+async def _fetch_many(ids, db):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+    # Tenta de novo as conexões que falham ao abrir
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2, limits=limits, retries=3)
+
+    async with httpx.AsyncClient(headers=headers, transport=transport, timeout=10) as client:
+        async def fetch(orcid_id):
+            orcid_id = _normalize_orcid(orcid_id)
+            cached = _cache_get(db, orcid_id)
+            if cached and time.time() - cached[0] < CACHE_TTL_SECONDS:
+                return httpx.Response(200, content=cached[2])
+
+            request_headers = {}
+            if cached and cached[1]:
+                # Requisição condicional: se nada mudou, o ORCID responde 304 sem corpo
+                request_headers["If-None-Match"] = cached[1]
+
+            async with semaphore:
+                response = await client.get(f"{BASE_URL}/{orcid_id}", headers=request_headers)
+            if response.status_code == 304 and cached:
+                _cache_put(db, orcid_id, cached[1], cached[2])
+                return httpx.Response(200, content=cached[2])
+            if response.status_code == 200:
+                _cache_put(db, orcid_id, response.headers.get("ETag"), response.content)
+            return response
+
+        return await asyncio.gather(*(fetch(orcid_id) for orcid_id in ids))
+
+
+def fetch_many(ids):
+    """Busca vários registros ORCID em paralelo, na mesma ordem de `ids`.
+
+    Registros buscados há menos de CACHE_TTL_SECONDS vêm do cache em disco,
+    sem requisição; os vencidos são revalidados com If-None-Match.
+    """
+    db = _open_cache()
+    try:
+        with db:
+            return asyncio.run(_fetch_many(ids, db))
+    finally:
+        db.close()
+
+
+orcid_ids = ["0000-0003-1574-0784"]
 
-if response.status_code == 200:
-    data = response.json()
-    nome = data['person']['name']['given-names']['value']
-    sobrenome = data['person']['name']['family-name']['value']
-    print(f"Nome completo: {nome} {sobrenome}")
-else:
-    print(f"Erro na requisição: {response.status_code}")
\ No newline at end of file
+for response in fetch_many(orcid_ids):
+    if response.status_code == 200:
+        data = parse_json(response)
+        nome = data['person']['name']['given-names']['value']
+        sobrenome = data['person']['name']['family-name']['value']
+        print(f"Nome completo: {nome} {sobrenome}")
+    else:
+        print(f"Erro na requisição: {response.status_code}")
@@ -3,81 +3,116 @@ burndown_sprint1_manual.py
 
 Gera um burndown chart da Sprint 1 (19–24 Maio 2025) a partir de dados
 manuais de issues, datas planejadas e datas reais de conclusão.
+
+Cada sprint em SPRINTS gera um PNG independente; com mais de uma sprint,
+os gráficos são renderizados em paralelo, um processo por sprint.
 """
 
 import datetime as dt
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # saída só em arquivo: evita inicializar backends de GUI (Tk/Qt)
 import matplotlib.pyplot as plt
 from matplotlib.dates import DateFormatter
 from matplotlib.ticker import MaxNLocator
 import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
-# ───────────── Configuração das Issues ─────────────
-issues = [
-    {"title": "Diagrama de componentes",         "planned_end": "2025-05-20", "done_at": "2025-05-19"},
-    {"title": "Modelo de dados ORCID",           "planned_end": "2025-05-20", "done_at": "2025-05-20"},
-    {"title": "Escrever 6 casos de uso",         "planned_end": "2025-05-21", "done_at": "2025-05-21"},
-    {"title": "Definir 6 casos de teste",        "planned_end": "2025-05-21", "done_at": "2025-05-18"},
-    {"title": "Protótipo de funcionalidade de busca", "planned_end": "2025-05-22", "done_at": "2025-05-20"},
-    {"title": "Protótipo de visualizações",      "planned_end": "2025-05-23", "done_at": "2025-05-21"},
-    {"title": "Projetar esquema da base de dados","planned_end": "2025-05-23", "done_at": "2025-05-20"},
-    {"title": "Prototipagem de UI",              "planned_end": "2025-05-24", "done_at": "2025-05-21"},
-    {"title": "Project Board & burndown",        "planned_end": "2025-05-19", "done_at": "2025-05-19"},
+# ───────────── Configuração das Sprints ─────────────
+SPRINTS = [
+    {
+        "title": "Burndown – Sprint 1: MVP Interface Preliminar",
+        "output": "burndown_sprint1.png",
+        "start": dt.date(2025, 5, 19),
+        "end": dt.date(2025, 5, 24),
+        "issues": [
+            {"title": "Diagrama de componentes",         "planned_end": "2025-05-20", "done_at": "2025-05-19"},
+            {"title": "Modelo de dados ORCID",           "planned_end": "2025-05-20", "done_at": "2025-05-20"},
+            {"title": "Escrever 6 casos de uso",         "planned_end": "2025-05-21", "done_at": "2025-05-21"},
+            {"title": "Definir 6 casos de teste",        "planned_end": "2025-05-21", "done_at": "2025-05-18"},
+            {"title": "Protótipo de funcionalidade de busca", "planned_end": "2025-05-22", "done_at": "2025-05-20"},
+            {"title": "Protótipo de visualizações",      "planned_end": "2025-05-23", "done_at": "2025-05-21"},
+            {"title": "Projetar esquema da base de dados","planned_end": "2025-05-23", "done_at": "2025-05-20"},
+            {"title": "Prototipagem de UI",              "planned_end": "2025-05-24", "done_at": "2025-05-21"},
+            {"title": "Project Board & burndown",        "planned_end": "2025-05-19", "done_at": "2025-05-19"},
+        ],
+    },
 ]
 
 
-# ───────────── Datas da Sprint ─────────────
-start = dt.date(2025, 5, 19)
-end   = dt.date(2025, 5, 24)
-timeline = [start + dt.timedelta(days=i) for i in range((end - start).days + 1)]
-total_issues = len(issues)
-
-# ───────────── Cálculo do burndown ─────────────
-remaining = []
-for day in timeline:
-    open_count = 0
-    for issue in issues:
-        done = (dt.datetime.strptime(issue["done_at"], "%Y-%m-%d").date()
-                if issue["done_at"] else None)
-        if not done or done > day:
-            open_count += 1
-    remaining.append(open_count)
-
-ideal = [
-    total_issues - (i * total_issues / (len(timeline)-1))
-    for i in range(len(timeline))
-]
+# ───────────── Escolha do diretório de saída ─────────────
+def choose_save_dir():
+    # docs/ na raiz do repositório, independente de onde o script é executado
+    base_docs = Path(__file__).resolve().parent.parent / "docs"
+    # ordem de preferência de pastas em docs/:
+    candidates = ["metrics", "architecture", "tests", "requirements", "interviews"]
 
-# ───────────── Plotagem ─────────────
-plt.figure(figsize=(10, 6))
-plt.plot(timeline, remaining, marker='o', label="Real")
-plt.plot(timeline, ideal, linestyle='--', label="Ideal")
-plt.title("Burndown – Sprint 1: MVP Interface Preliminar")
-plt.xlabel("Data")
-plt.ylabel("Issues abertas")
-plt.xticks(rotation=45)
-plt.grid(True, linestyle='--', alpha=0.5)
-plt.gca().xaxis.set_major_formatter(DateFormatter('%b %d'))
-plt.gca().xaxis.set_major_locator(MaxNLocator(integer=True))
-plt.legend()
-plt.tight_layout()
+    # uma única listagem de docs/ em vez de um stat por candidata
+    try:
+        existing = {entry.name for entry in os.scandir(base_docs) if entry.is_dir()}
+    except FileNotFoundError:
+        existing = set()
 
-# ───────────── Escolha do diretório de saída ─────────────
-base_docs = os.path.join(os.getcwd(), "docs")
-# ordem de preferência de pastas em docs/:
-candidates = ["metrics", "architecture", "tests", "requirements", "interviews"]
-save_dir = None
-
-for sub in candidates:
-    path = os.path.join(base_docs, sub)
-    if os.path.isdir(path):
-        save_dir = path
-        break
-
-# se não encontrou nenhuma, cria docs/metrics
-if save_dir is None:
-    save_dir = os.path.join(base_docs, "metrics")
-    os.makedirs(save_dir, exist_ok=True)
-
-output_path = os.path.join(save_dir, "burndown_sprint1.png")
-plt.savefig(output_path, dpi=120)
-print(f"✅ Gráfico salvo em {output_path}")
+    # primeira pasta existente; se não encontrou nenhuma, usa (e cria) docs/metrics
+    save_dir = next((base_docs / sub for sub in candidates if sub in existing),
+                    base_docs / "metrics")
+    save_dir.mkdir(parents=True, exist_ok=True)
+    return save_dir
+
+
+def render_sprint(sprint, save_dir):
+    issues = sprint["issues"]
+
+    # ───────────── Datas da Sprint ─────────────
+    start, end = sprint["start"], sprint["end"]
+    timeline = [start + dt.timedelta(days=i) for i in range((end - start).days + 1)]
+    total_issues = len(issues)
+
+    # ───────────── Cálculo do burndown ─────────────
+    # Cada done_at é convertido uma única vez, fora de qualquer laço
+    done_dates = [dt.date.fromisoformat(issue["done_at"]) if issue["done_at"] else None
+                  for issue in issues]
+    # Issues sem data de conclusão ficam abertas até o fim: data sentinela no futuro
+    done = np.array([d or dt.date.max for d in done_dates], dtype="datetime64[D]")
+    days = np.arange(start, end + dt.timedelta(days=1), dtype="datetime64[D]")
+    # Uma issue está aberta no dia d se foi concluída depois de d
+    remaining = (done[None, :] > days[:, None]).sum(axis=1).tolist()
+
+    ideal = [
+        total_issues - (i * total_issues / (len(timeline)-1))
+        for i in range(len(timeline))
+    ]
+
+    # ───────────── Plotagem ─────────────
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.plot(timeline, remaining, marker='o', label="Real")
+    ax.plot(timeline, ideal, linestyle='--', label="Ideal")
+    ax.set_title(sprint["title"])
+    ax.set_xlabel("Data")
+    ax.set_ylabel("Issues abertas")
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.grid(True, linestyle='--', alpha=0.5)
+    ax.xaxis.set_major_formatter(DateFormatter('%b %d'))
+    ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+    ax.legend()
+    fig.tight_layout()
+
+    output_path = save_dir / sprint["output"]
+    fig.savefig(output_path, dpi=120)
+    plt.close(fig)
+    return output_path
+
+
+if __name__ == "__main__":
+    save_dir = choose_save_dir()
+
+    if len(SPRINTS) == 1:
+        output_paths = [render_sprint(SPRINTS[0], save_dir)]
+    else:
+        # Renderização é CPU-bound: um processo por sprint contorna o GIL
+        with ProcessPoolExecutor(max_workers=min(len(SPRINTS), os.cpu_count() or 1)) as executor:
+            output_paths = list(executor.map(render_sprint, SPRINTS, [save_dir] * len(SPRINTS)))
+
+    for output_path in output_paths:
+        print(f"✅ Gráfico salvo em {output_path}")
@@ -4,14 +4,122 @@ Django admin configuration for ORCID Research Platform models
 
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from django.utils.html import format_html
+from django.core.cache import cache
+from django.db.models import Case, CharField, Value, When
+from django.db.models.functions import Concat, Length, Substr
+from django.db.models.lookups import GreaterThan
+from django.utils import timezone
 from .models import (
-    User, Institution, Affiliation, Work, WorkAuthor, Funding,
-    ResearchArea, UserResearchArea, Citation, UserMetrics,
-    CollaborationNetwork, CitationTimeSeries, APIUsageLog
+    User, UserOrcidToken, SocialMediaAccount, Institution, Affiliation, Work, WorkAuthor,
+    WorkKeyword, Funding, ResearchArea, UserResearchArea, Citation, UserMetrics,
+    CollaborationNetwork, CitationTimeSeries, APIUsageLog, CrossrefCitationCache
 )
 
 
+def truncated(field, length):
+    """Truncate a text column in SQL, appending '...' when it is cut"""
+    return Case(
+        When(GreaterThan(Length(field), length),
+             then=Concat(Substr(field, 1, length), Value('...'), output_field=CharField())),
+        default=field,
+        output_field=CharField(),
+    )
+
+
+# List filters for high-cardinality columns. The default field filters run a
+# SELECT DISTINCT over the whole table on every changelist load; these offer
+# static buckets (or a cached list) instead.
+
+class PublicationDecadeFilter(admin.SimpleListFilter):
+    """Filter works by publication decade"""
+    title = 'publication decade'
+    parameter_name = 'decade'
+
+    def lookups(self, request, model_admin):
+        current_decade = timezone.now().year // 10 * 10
+        return [(str(decade), f'{decade}s') for decade in range(current_decade, 1949, -10)]
+
+    def queryset(self, request, queryset):
+        # Ignore values that are not one of the offered buckets, e.g. a hand-edited query string
+        if self.value() not in dict(self.lookup_choices):
+            return queryset
+        decade = int(self.value())
+        return queryset.filter(publication_year__gte=decade, publication_year__lt=decade + 10)
+
+
+class CollaborationCountFilter(admin.SimpleListFilter):
+    """Filter collaborations by number of shared works"""
+    title = 'total collaborations'
+    parameter_name = 'collaborations'
+
+    BUCKETS = {
+        '1': (1, 1),
+        '2-5': (2, 5),
+        '6-10': (6, 10),
+        '11+': (11, None),
+    }
+
+    def lookups(self, request, model_admin):
+        return [(key, key) for key in self.BUCKETS]
+
+    def queryset(self, request, queryset):
+        if self.value() not in self.BUCKETS:
+            return queryset
+        low, high = self.BUCKETS[self.value()]
+        queryset = queryset.filter(total_collaborations__gte=low)
+        return queryset if high is None else queryset.filter(total_collaborations__lte=high)
+
+
+class StatusClassFilter(admin.SimpleListFilter):
+    """Filter API logs by HTTP status class (2xx, 4xx, ...)"""
+    title = 'status code'
+    parameter_name = 'status_class'
+
+    def lookups(self, request, model_admin):
+        return [(str(code), f'{code}xx') for code in range(1, 6)]
+
+    def queryset(self, request, queryset):
+        if self.value() not in dict(self.lookup_choices):
+            return queryset
+        low = int(self.value()) * 100
+        return queryset.filter(status_code__gte=low, status_code__lt=low + 100)
+
+
+class EndpointFilter(admin.SimpleListFilter):
+    """Filter API logs by endpoint, with the endpoint list cached for a few minutes"""
+    title = 'endpoint'
+    parameter_name = 'endpoint'
+
+    def lookups(self, request, model_admin):
+        endpoints = cache.get_or_set(
+            'admin:apiusagelog:endpoints',
+            lambda: list(
+                APIUsageLog.objects.order_by('endpoint')
+                .values_list('endpoint', flat=True).distinct()[:50]
+            ),
+            300,
+        )
+        return [(endpoint, endpoint) for endpoint in endpoints]
+
+    def queryset(self, request, queryset):
+        if self.value() is None:
+            return queryset
+        return queryset.filter(endpoint=self.value())
+
+
+class UserOrcidTokenInline(admin.StackedInline):
+    """Inline admin for UserOrcidToken"""
+    model = UserOrcidToken
+    extra = 0
+    readonly_fields = ['updated_at']
+
+
+class SocialMediaAccountInline(admin.TabularInline):
+    """Inline admin for SocialMediaAccount"""
+    model = SocialMediaAccount
+    extra = 0
+
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     """Admin configuration for User model"""
@@ -26,13 +134,14 @@ class UserAdmin(BaseUserAdmin):
     ]
     search_fields = ['username', 'email', 'orcid_id', 'display_name']
     readonly_fields = ['id', 'date_joined', 'last_login', 'last_orcid_sync']
+    inlines = [UserOrcidTokenInline, SocialMediaAccountInline]
     
     fieldsets = BaseUserAdmin.fieldsets + (
         ('ORCID Information', {
-            'fields': ('orcid_id', 'orcid_access_token', 'orcid_refresh_token', 'orcid_token_expires_at')
+            'fields': ('orcid_id',)
         }),
         ('Profile Information', {
-            'fields': ('display_name', 'biography', 'profile_picture_url', 'website_url', 'social_media_accounts')
+            'fields': ('display_name', 'biography', 'profile_picture_url', 'website_url')
         }),
         ('Privacy Settings', {
             'fields': ('profile_public', 'show_publications', 'show_affiliations', 'show_metrics')
@@ -85,6 +194,7 @@ class AffiliationAdmin(admin.ModelAdmin):
     search_fields = ['user__username', 'institution__name', 'title', 'department']
     readonly_fields = ['id', 'created_at', 'updated_at']
     raw_id_fields = ['user', 'institution']
+    list_select_related = ['user', 'institution']
     
     fieldsets = (
         ('Basic Information', {
@@ -108,7 +218,7 @@ class WorkAdmin(admin.ModelAdmin):
     """Admin configuration for Work model"""
     
     list_display = ['title_short', 'work_type', 'publication_year', 'citation_count', 'doi']
-    list_filter = ['work_type', 'publication_year', 'visibility', 'language']
+    list_filter = ['work_type', PublicationDecadeFilter, 'visibility', 'language']
     search_fields = ['title', 'doi', 'pmid', 'journal_title']
     readonly_fields = ['id', 'created_at', 'updated_at', 'last_citation_update']
     
@@ -123,7 +233,7 @@ class WorkAdmin(admin.ModelAdmin):
             'fields': ('doi', 'pmid', 'isbn', 'issn', 'arxiv_id')
         }),
         ('Content', {
-            'fields': ('abstract', 'keywords'),
+            'fields': ('abstract',),
             'classes': ('collapse',)
         }),
         ('URLs', {
@@ -140,10 +250,10 @@ class WorkAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
-    
-    def title_short(self, obj):
-        return obj.title[:100] + '...' if len(obj.title) > 100 else obj.title
-    title_short.short_description = 'Title'
+
+    def get_queryset(self, request):
+        # abstract is only shown on the change form
+        return super().get_queryset(request).defer('abstract')
 
 
 class WorkAuthorInline(admin.TabularInline):
@@ -153,6 +263,21 @@ class WorkAuthorInline(admin.TabularInline):
     readonly_fields = ['created_at']
     raw_id_fields = ['user']
 
+    def get_queryset(self, request):
+        # The tabular rows render WorkAuthor.__str__, which reads work.title
+        return super().get_queryset(request).select_related('work', 'user')
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'user':
+            kwargs['queryset'] = User.objects.only('id', 'username', 'orcid_id', 'display_name')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
+class WorkKeywordInline(admin.TabularInline):
+    """Inline admin for WorkKeyword"""
+    model = WorkKeyword
+    extra = 0
+
 
 @admin.register(WorkAuthor)
 class WorkAuthorAdmin(admin.ModelAdmin):
@@ -163,10 +288,16 @@ class WorkAuthorAdmin(admin.ModelAdmin):
     search_fields = ['name', 'orcid_id', 'email', 'work__title']
     readonly_fields = ['id', 'created_at']
     raw_id_fields = ['work', 'user']
+    show_full_result_count = False
+    list_per_page = 50
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(work_title_short=truncated('work__title', 50))
+
     def work_title_short(self, obj):
-        return obj.work.title[:50] + '...' if len(obj.work.title) > 50 else obj.work.title
+        return obj.work_title_short
     work_title_short.short_description = 'Work'
+    work_title_short.admin_order_field = 'work__title'
 
 
 @admin.register(Funding)
@@ -178,6 +309,7 @@ class FundingAdmin(admin.ModelAdmin):
     search_fields = ['title', 'organization_name', 'grant_number', 'user__username']
     readonly_fields = ['id', 'created_at', 'updated_at']
     raw_id_fields = ['user']
+    list_select_related = ['user']
     
     fieldsets = (
         ('Basic Information', {
@@ -213,6 +345,7 @@ class ResearchAreaAdmin(admin.ModelAdmin):
     list_filter = ['subject_scheme', 'parent']
     search_fields = ['name', 'description', 'subject_scheme']
     readonly_fields = ['id', 'created_at']
+    list_select_related = ['parent']
     
     fieldsets = (
         ('Basic Information', {
@@ -237,6 +370,7 @@ class UserResearchAreaAdmin(admin.ModelAdmin):
     search_fields = ['user__username', 'research_area__name']
     readonly_fields = ['id', 'created_at']
     raw_id_fields = ['user', 'research_area']
+    list_select_related = ['user', 'research_area', 'research_area__parent']
 
 
 @admin.register(Citation)
@@ -248,14 +382,27 @@ class CitationAdmin(admin.ModelAdmin):
     search_fields = ['citing_work__title', 'cited_work__title']
     readonly_fields = ['id', 'discovered_at']
     raw_id_fields = ['citing_work', 'cited_work']
+    show_full_result_count = False
+    list_per_page = 50
     
+    def get_queryset(self, request):
+        # Titles come from the annotations, so the Work rows themselves are never loaded
+        return super().get_queryset(request).only(
+            'id', 'citing_work_id', 'cited_work_id', 'source', 'discovered_at'
+        ).annotate(
+            citing_work_short=truncated('citing_work__title', 50),
+            cited_work_short=truncated('cited_work__title', 50),
+        )
+
     def citing_work_short(self, obj):
-        return obj.citing_work.title[:50] + '...' if len(obj.citing_work.title) > 50 else obj.citing_work.title
+        return obj.citing_work_short
     citing_work_short.short_description = 'Citing Work'
+    citing_work_short.admin_order_field = 'citing_work__title'
     
     def cited_work_short(self, obj):
-        return obj.cited_work.title[:50] + '...' if len(obj.cited_work.title) > 50 else obj.cited_work.title
+        return obj.cited_work_short
     cited_work_short.short_description = 'Cited Work'
+    cited_work_short.admin_order_field = 'cited_work__title'
 
 
 @admin.register(UserMetrics)
@@ -268,8 +415,9 @@ class UserMetricsAdmin(admin.ModelAdmin):
     ]
     list_filter = ['calculation_version', 'last_calculated']
     search_fields = ['user__username', 'user__orcid_id']
-    readonly_fields = ['id', 'last_calculated']
+    readonly_fields = ['id', 'last_calculated', 'years_active', 'avg_citations_per_paper']
     raw_id_fields = ['user']
+    list_select_related = ['user']
     
     fieldsets = (
         ('User', {
@@ -299,11 +447,11 @@ class CollaborationNetworkAdmin(admin.ModelAdmin):
     """Admin configuration for CollaborationNetwork model"""
     
     list_display = ['user1', 'user2', 'total_collaborations', 'first_collaboration_date', 'last_collaboration_date']
-    list_filter = ['total_collaborations', 'first_collaboration_date']
+    list_filter = [CollaborationCountFilter, 'first_collaboration_date']
     search_fields = ['user1__username', 'user2__username']
     readonly_fields = ['id', 'created_at', 'updated_at']
     raw_id_fields = ['user1', 'user2']
-    filter_horizontal = ['shared_works']
+    list_select_related = ['user1', 'user2']
 
 
 @admin.register(CitationTimeSeries)
@@ -315,6 +463,8 @@ class CitationTimeSeriesAdmin(admin.ModelAdmin):
     search_fields = ['user__username', 'user__orcid_id']
     readonly_fields = ['id', 'created_at', 'updated_at']
     raw_id_fields = ['user']
+    show_full_result_count = False
+    list_per_page = 50
     
     fieldsets = (
         ('Citation Data', {
@@ -335,10 +485,15 @@ class APIUsageLogAdmin(admin.ModelAdmin):
     """Admin configuration for APIUsageLog model"""
     
     list_display = ['endpoint', 'method', 'user', 'ip_address', 'status_code', 'response_time_ms', 'timestamp']
-    list_filter = ['method', 'status_code', 'endpoint', 'timestamp']
+    list_filter = ['method', StatusClassFilter, EndpointFilter, 'timestamp']
     search_fields = ['endpoint', 'user__username', 'ip_address', 'user_agent']
     readonly_fields = ['id', 'timestamp']
     raw_id_fields = ['user']
+    list_select_related = ['user']
+    show_full_result_count = False
+    list_per_page = 50
+    # Only offer sorting on indexed columns; this table grows without bound
+    sortable_by = ['endpoint', 'timestamp']
     
     date_hierarchy = 'timestamp'
     
@@ -357,6 +512,23 @@ class APIUsageLogAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        # user_agent and rate_limit_key are only shown on the change form
+        return super().get_queryset(request).defer('user_agent', 'rate_limit_key')
+
+
+@admin.register(CrossrefCitationCache)
+class CrossrefCitationCacheAdmin(admin.ModelAdmin):
+    """Admin configuration for CrossrefCitationCache model"""
+    
+    list_display = ['doi', 'citation_count', 'fetched_at']
+    search_fields = ['doi']
+    readonly_fields = ['fetched_at']
+    show_full_result_count = False
+    list_per_page = 50
+    
+    date_hierarchy = 'fetched_at'
+
 
 # Enhance Work admin with author inline
-WorkAdmin.inlines = [WorkAuthorInline] 
\ No newline at end of file
+WorkAdmin.inlines = [WorkAuthorInline, WorkKeywordInline] 
\ No newline at end of file
@@ -0,0 +1,16 @@
+"""
+Celery application for running ORCID population jobs on worker processes.
+
+Start a worker bound to the ORCID queue with:
+    celery -A config worker -Q orcid
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+app = Celery('config')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
@@ -0,0 +1,30 @@
+"""
+Django management command to clear cached CrossRef citation counts
+"""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from config.models import CrossrefCitationCache
+from integrations.crossref_api import CITATION_CACHE_TTL
+
+
+class Command(BaseCommand):
+    help = 'Clear cached CrossRef citation counts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--expired',
+            action='store_true',
+            help='Only remove entries older than the cache TTL'
+        )
+
+    def handle(self, *args, **options):
+        entries = CrossrefCitationCache.objects.all()
+        if options.get('expired', False):
+            entries = entries.filter(fetched_at__lt=timezone.now() - CITATION_CACHE_TTL)
+
+        deleted, _ = entries.delete()
+        self.stdout.write(
+            self.style.SUCCESS(f'✅ Removed {deleted} cached citation count(s)')
+        )
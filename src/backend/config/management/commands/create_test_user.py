@@ -44,28 +44,28 @@ class Command(BaseCommand):
         orcid_id = options.get('orcid_id')
 
         try:
-            # Check if user already exists
-            if User.objects.filter(username=username).exists():
+            user, created = User.objects.get_or_create(
+                username=username,
+                defaults={
+                    'email': User.objects.normalize_email(email),
+                    'orcid_id': orcid_id or None,
+                }
+            )
+
+            if not created:
                 self.stdout.write(
                     self.style.WARNING(f'User "{username}" already exists!')
                 )
-                user = User.objects.get(username=username)
                 self.stdout.write(f'Existing user ID: {user.id}')
                 self.stdout.write(f'Is superuser: {user.is_superuser}')
                 self.stdout.write(f'Is staff: {user.is_staff}')
                 return
 
-            # Create superuser
-            user = User.objects.create_superuser(
-                username=username,
-                email=email,
-                password=password
-            )
-
-            # Add ORCID ID if provided
-            if orcid_id:
-                user.orcid_id = orcid_id
-                user.save()
+            # Promote the new user to superuser, writing only the changed columns
+            user.set_password(password)
+            user.is_superuser = True
+            user.is_staff = True
+            user.save(update_fields=['password', 'is_superuser', 'is_staff'])
 
             self.stdout.write(
                 self.style.SUCCESS(f'Successfully created superuser "{username}"')
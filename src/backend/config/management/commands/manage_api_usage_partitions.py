@@ -0,0 +1,54 @@
+"""
+Django management command to maintain the monthly partitions of api_usage_logs
+Usage: python manage.py manage_api_usage_partitions [--months-ahead N] [--retain-months N]
+"""
+
+from decouple import config
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from config.partitions import add_months, drop_partitions_before, ensure_partitions, month_start
+
+
+class Command(BaseCommand):
+    help = 'Create upcoming monthly partitions of api_usage_logs and drop expired ones (PostgreSQL only)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=3,
+            help='Months to create beyond the current one (default: 3)',
+        )
+        parser.add_argument(
+            '--retain-months',
+            type=int,
+            default=config('API_USAGE_LOG_RETENTION_MONTHS', default=12, cast=int),
+            help='Months of logs to keep, the current one included; 0 keeps everything '
+                 '(default: API_USAGE_LOG_RETENTION_MONTHS or 12)',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            self.stdout.write('api_usage_logs is only partitioned on PostgreSQL, nothing to do.')
+            return
+
+        current_month = month_start(timezone.now())
+        with transaction.atomic(), connection.cursor() as cursor:
+            created = ensure_partitions(
+                cursor, current_month, add_months(current_month, options['months_ahead'])
+            )
+            dropped = []
+            if options['retain_months'] > 0:
+                dropped = drop_partitions_before(
+                    cursor, add_months(current_month, 1 - options['retain_months'])
+                )
+
+        for name in created:
+            self.stdout.write(f'  Created partition {name}')
+        for name in dropped:
+            self.stdout.write(f'  Dropped partition {name}')
+        self.stdout.write(
+            self.style.SUCCESS(f'✅ Created {len(created)} and dropped {len(dropped)} partition(s)')
+        )
@@ -2,11 +2,15 @@
 Django management command to populate a user with ORCID data and citations
 """
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
 from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Min, Q, Sum, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
+import functools
 import json
 import time
 import random
@@ -24,6 +28,49 @@ from integrations.crossref_api import PublicationAPIClient
 
 User = get_user_model()
 
+# Columns refreshed from ORCID when a work or funding entry is synced again.
+# orcid_put_code is left out for works: a work is shared by its co-authors,
+# while a put-code belongs to one author's ORCID record
+WORK_ORCID_FIELDS = [
+    'title', 'title_short', 'work_type', 'journal_title', 'publication_date', 'publication_year', 'url',
+]
+FUNDING_ORCID_FIELDS = [
+    'funding_type', 'organization_name', 'organization_country', 'start_date', 'end_date', 'url',
+    'orcid_put_code',
+]
+
+
+def _dig(obj, *path, default=''):
+    """Follow nested keys in ORCID JSON, returning default when a step is missing or null"""
+    for key in path:
+        if not isinstance(obj, dict):
+            return default
+        obj = obj.get(key)
+    return default if obj is None else obj
+
+
+def _refresh_fields(instance, values):
+    """Copy values onto instance, returning whether any field changed"""
+    changed = False
+    for field, value in values.items():
+        if getattr(instance, field) != value:
+            setattr(instance, field, value)
+            changed = True
+    return changed
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ymd(year, month, day):
+    """Build a date from ORCID year/month/day values; memoized since profiles repeat the same dates"""
+    try:
+        year, month, day = int(year), int(month), int(day)
+        if year > 0:
+            return date(year, month, day)
+    except (ValueError, TypeError):
+        pass
+    
+    return None
+
 
 class Command(BaseCommand):
     help = 'Populate a user with ORCID data and citations'
@@ -67,6 +114,17 @@ class Command(BaseCommand):
             action='store_true',
             help='Force update if user already exists'
         )
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Bypass the ORCID response cache and fetch fresh data'
+        )
+        parser.add_argument(
+            '--async',
+            action='store_true',
+            dest='run_async',
+            help='Enqueue the population as a Celery task instead of running it here'
+        )
 
     def handle(self, *args, **options):
         # Support both command-line and programmatic calls
@@ -77,6 +135,7 @@ class Command(BaseCommand):
         max_publications = options.get('max_publications', 10)
         skip_citations = options.get('skip_citations', False)
         force = options.get('force', False)
+        no_cache = options.get('no_cache', False)
 
         if not orcid_id:
             self.stdout.write(
@@ -84,104 +143,131 @@ class Command(BaseCommand):
             )
             return
 
+        if options.get('run_async', False):
+            self._enqueue(orcid_id, username=username, email=email, password=password,
+                          max_publications=max_publications, skip_citations=skip_citations,
+                          force=force, no_cache=no_cache)
+            return
+
         self.stdout.write(f'🔍 Fetching data for ORCID ID: {orcid_id}')
 
+        # Check if user exists before spending any request on the profile
+        user_exists = User.objects.filter(orcid_id=orcid_id).exists()
+        if user_exists and not force:
+            self.stdout.write(
+                self.style.WARNING(f'User with ORCID ID {orcid_id} already exists! Use --force to update.')
+            )
+            return
+
         try:
             # Initialize API clients
-            orcid_client = ORCIDAPIClient(access_token='', orcid_id=orcid_id)
+            orcid_client = ORCIDAPIClient(access_token='', orcid_id=orcid_id, use_cache=not no_cache)
             crossref_client = PublicationAPIClient()
 
-            # Get user identity and profile data
+            # Get user identity and profile data (independent requests, fetched concurrently).
+            # The citation analysis runs alongside them so its CrossRef requests are
+            # never made while the transaction below holds locks
             self.stdout.write('📋 Fetching ORCID profile data...')
-            user_identity = orcid_client.get_user_identity_info()
-            person_info = orcid_client.get_researcher_person_info()
-            works_data = orcid_client.get_researcher_works()
-            employments_data = orcid_client.get_researcher_employments()
-            education_data = orcid_client.get_researcher_education()
-            funding_data = orcid_client.get_researcher_funding()
+            with ThreadPoolExecutor(max_workers=7) as executor:
+                user_identity_future = executor.submit(orcid_client.get_user_identity_info)
+                person_info_future = executor.submit(orcid_client.get_researcher_person_info)
+                works_future = executor.submit(orcid_client.get_researcher_works)
+                employments_future = executor.submit(orcid_client.get_researcher_employments)
+                education_future = executor.submit(orcid_client.get_researcher_education)
+                funding_future = executor.submit(orcid_client.get_researcher_funding)
+                citation_analysis_future = None
+                if not skip_citations:
+                    citation_analysis_future = executor.submit(
+                        orcid_client.get_citation_analysis,
+                        years_back=10,
+                        max_publications=max_publications,
+                        timeout_per_request=15
+                    )
+
+            user_identity = user_identity_future.result()
+            person_info = person_info_future.result()
+            works_data = works_future.result()
+            employments_data = employments_future.result()
+            education_data = education_future.result()
+            funding_data = funding_future.result()
 
             # Generate username if not provided
             if not username:
                 name_parts = user_identity.get('name', 'User').lower().split()
                 username = f"{''.join(name_parts[:2])}_{orcid_id.replace('-', '')[-4:]}"
 
-            # Check if user exists
-            user_exists = User.objects.filter(orcid_id=orcid_id).exists()
-            if user_exists and not force:
-                self.stdout.write(
-                    self.style.WARNING(f'User with ORCID ID {orcid_id} already exists! Use --force to update.')
-                )
-                return
-
+            # One transaction for the whole population; each phase is a savepoint
+            # inside it, so a failing phase rolls back without leaving partial data
             with transaction.atomic():
-                # Create or update user
-                if user_exists:
-                    user = User.objects.get(orcid_id=orcid_id)
-                    self.stdout.write(f'📝 Updating existing user: {user.username}')
-                else:
-                    user = User.objects.create_user(
-                        username=username,
-                        email=email or f"{username}@example.com",
-                        password=password
-                    )
-                    self.stdout.write(f'👤 Created new user: {username}')
-
-                # Update user profile with ORCID data
-                user.orcid_id = orcid_id
-                user.display_name = user_identity.get('name', '')
-                user.first_name = person_info.get('name', {}).get('given-names', {}).get('value', '') if person_info.get('name') else ''
-                user.last_name = person_info.get('name', {}).get('family-name', {}).get('value', '') if person_info.get('name') else ''
-                user.last_orcid_sync = timezone.now()
-                
-                # Extract biography from person info
-                if person_info.get('biography') and person_info['biography'].get('content'):
-                    user.biography = person_info['biography']['content']
-                
-                user.save()
+                with transaction.atomic():
+                    # Create or update user
+                    if user_exists:
+                        user = User.objects.get(orcid_id=orcid_id)
+                        self.stdout.write(f'📝 Updating existing user: {user.username}')
+                    else:
+                        user = User.objects.create_user(
+                            username=username,
+                            email=email or f"{username}@example.com",
+                            password=password
+                        )
+                        self.stdout.write(f'👤 Created new user: {username}')
+
+                    # Update user profile with ORCID data
+                    user.orcid_id = orcid_id
+                    user.display_name = user_identity.get('name', '')
+                    user.first_name = _dig(person_info, 'name', 'given-names', 'value')
+                    user.last_name = _dig(person_info, 'name', 'family-name', 'value')
+                    user.last_orcid_sync = timezone.now()
+
+                    # Extract biography from person info
+                    if person_info.get('biography') and person_info['biography'].get('content'):
+                        user.biography = person_info['biography']['content']
+
+                    user.save()
 
                 # Process institutions and affiliations
                 self.stdout.write('🏢 Processing affiliations...')
-                self._process_affiliations(user, employments_data, 'employment')
-                self._process_affiliations(user, education_data, 'education')
+                with transaction.atomic():
+                    affiliations_total = self._process_affiliations(user, employments_data, 'employment')
+                    affiliations_total += self._process_affiliations(user, education_data, 'education')
 
                 # Process funding
                 self.stdout.write('💰 Processing funding...')
-                self._process_funding(user, funding_data)
+                with transaction.atomic():
+                    funding_total = self._process_funding(user, funding_data)
 
                 # Process publications
                 self.stdout.write('📚 Processing publications...')
-                publications_created = self._process_publications(
-                    user, works_data, crossref_client, max_publications, skip_citations
-                )
-
-                # Get real citation analysis using the existing ORCID API function
-                if not skip_citations and publications_created > 0:
-                    self.stdout.write('📊 Fetching real citation analysis data...')
-                    citation_analysis = orcid_client.get_citation_analysis(
-                        years_back=10, 
-                        max_publications=max_publications,
-                        timeout_per_request=15
+                with transaction.atomic():
+                    publications_total = self._process_publications(
+                        user, works_data, crossref_client, max_publications, skip_citations
                     )
-                    
+
+                # Store the real citation analysis fetched with the profile
+                if citation_analysis_future is not None and publications_total > 0:
+                    self.stdout.write('📊 Storing real citation analysis data...')
+                    citation_analysis = citation_analysis_future.result()
+
                     # Store citation time series from real data
                     self._store_citation_analysis(user, citation_analysis)
-                    
+
                     self.stdout.write(f'   📈 Citation analysis: {citation_analysis["total_citations"]} total citations')
                     self.stdout.write(f'   📚 Publications analyzed: {citation_analysis["total_publications"]}')
                     self.stdout.write(f'   ⏱️  Analysis time: {citation_analysis["analysis_time_seconds"]}s')
 
                 # Calculate and store user metrics
                 self.stdout.write('📊 Calculating user metrics...')
-                self._calculate_user_metrics(user)
+                with transaction.atomic():
+                    self._calculate_user_metrics(user)
 
-                self.stdout.write(
-                    self.style.SUCCESS(f'✅ Successfully populated user data!')
-                )
-                self.stdout.write(f'   👤 User: {user.username} ({user.display_name})')
-                self.stdout.write(f'   🆔 ORCID: {user.orcid_id}')
-                self.stdout.write(f'   📚 Publications: {publications_created}')
-                self.stdout.write(f'   🏢 Affiliations: {user.affiliations.count()}')
-                self.stdout.write(f'   💰 Funding: {user.funding.count()}')
+            self.stdout.write(
+                self.style.SUCCESS(f'✅ Successfully populated user data!')
+            )
+            self.stdout.write(f'   👤 User: {user.username} ({user.display_name})')
+            self.stdout.write(f'   🆔 ORCID: {user.orcid_id}')
+            self.stdout.write(f'   📚 Publications: {publications_total}')
+            self.stdout.write(f'   🏢 Affiliations: {affiliations_total}')
+            self.stdout.write(f'   💰 Funding: {funding_total}')
 
         except Exception as e:
             self.stdout.write(
@@ -189,107 +275,228 @@ class Command(BaseCommand):
             )
             raise
 
+    def _enqueue(self, orcid_id, **task_options):
+        """Enqueue the population on the Celery 'orcid' queue"""
+        # config/__init__.py leaves celery_app as None when Celery is not installed
+        from config import celery_app
+        if celery_app is None:
+            raise CommandError('Celery is not installed; run without --async or install celery[redis].')
+
+        from config.tasks import populate_user_with_citations_task
+
+        result = populate_user_with_citations_task.delay(orcid_id, **task_options)
+        self.stdout.write(
+            self.style.SUCCESS(f'📨 Queued population for ORCID ID {orcid_id} (task {result.id})')
+        )
+
     def _process_affiliations(self, user, affiliations_data, affiliation_type):
-        """Process employment or education affiliations"""
+        """Process employment or education affiliations, returning how many were stored (created or updated)"""
         if not affiliations_data or 'affiliation-group' not in affiliations_data:
-            return
+            return 0
 
+        # Parse every summary first so institutions and affiliations can be written in bulk
+        parsed = []
         for group in affiliations_data['affiliation-group']:
             for summary in group.get('summaries', []):
                 try:
-                    org_name = summary.get('organization', {}).get('name', 'Unknown Organization')
-                    
-                    # Create or get institution
-                    institution, created = Institution.objects.get_or_create(
-                        name=org_name,
-                        defaults={
-                            'country': summary.get('organization', {}).get('address', {}).get('country', ''),
-                            'city': summary.get('organization', {}).get('address', {}).get('city', ''),
-                        }
-                    )
-
-                    # Parse dates
-                    start_date = self._parse_orcid_date(summary.get('start-date'))
                     end_date = self._parse_orcid_date(summary.get('end-date'))
-
-                    # Create affiliation
-                    Affiliation.objects.get_or_create(
-                        user=user,
-                        institution=institution,
-                        affiliation_type=affiliation_type,
-                        defaults={
-                            'title': summary.get('role-title', '') or summary.get('department-name', ''),
-                            'department': summary.get('department-name', ''),
-                            'start_date': start_date,
-                            'end_date': end_date,
-                            'is_current': end_date is None,
-                            'orcid_put_code': str(summary.get('put-code', '')),
-                        }
-                    )
-
+                    parsed.append({
+                        'org_name': _dig(summary, 'organization', 'name', default='Unknown Organization'),
+                        'country': _dig(summary, 'organization', 'address', 'country'),
+                        'city': _dig(summary, 'organization', 'address', 'city'),
+                        'title': summary.get('role-title', '') or summary.get('department-name', ''),
+                        'department': summary.get('department-name', ''),
+                        'start_date': self._parse_orcid_date(summary.get('start-date')),
+                        'end_date': end_date,
+                        'is_current': end_date is None,
+                        'orcid_put_code': str(summary.get('put-code', '')),
+                    })
                 except Exception as e:
                     self.stdout.write(f'⚠️  Warning: Could not process affiliation: {e}')
                     continue
 
+        if not parsed:
+            return 0
+
+        institution_ids = self._get_or_create_institutions(parsed)
+
+        # One affiliation per (user, institution, type, start date), the uniq_affil
+        # key, so separate stints at one institution stay separate rows: existing
+        # rows are refreshed from ORCID in one bulk UPDATE, the rest inserted in one INSERT
+        existing = {
+            (institution_id, start_date): affiliation_id
+            for affiliation_id, institution_id, start_date in Affiliation.objects.filter(
+                user=user,
+                affiliation_type=affiliation_type,
+                institution_id__in=set(institution_ids.values()),
+            ).values_list('id', 'institution_id', 'start_date')
+        }
+        seen = set()
+        new_affiliations = []
+        updated_affiliations = []
+        now = timezone.now()
+        for row in parsed:
+            institution_id = institution_ids[row['org_name']]
+            key = (institution_id, row['start_date'])
+            if key in seen:
+                continue
+            seen.add(key)
+            affiliation = Affiliation(
+                user=user,
+                institution_id=institution_id,
+                affiliation_type=affiliation_type,
+                title=row['title'],
+                department=row['department'],
+                start_date=row['start_date'],
+                end_date=row['end_date'],
+                is_current=row['is_current'],
+                orcid_put_code=row['orcid_put_code'],
+            )
+            if key in existing:
+                affiliation.id = existing[key]
+                affiliation.updated_at = now
+                updated_affiliations.append(affiliation)
+            else:
+                new_affiliations.append(affiliation)
+
+        # A concurrent sync of the same user may have inserted a row since the
+        # SELECT above; the unique constraints turn that into a no-op
+        Affiliation.objects.bulk_create(new_affiliations, batch_size=500, ignore_conflicts=True)
+        Affiliation.objects.bulk_update(
+            updated_affiliations,
+            ['title', 'department', 'start_date', 'end_date', 'is_current', 'orcid_put_code', 'updated_at'],
+            batch_size=500,
+        )
+        return len(seen)
+
+    def _get_or_create_institutions(self, parsed_affiliations):
+        """Map organization names to Institution ids, bulk-creating the missing ones
+        and filling in a blank country or city on the existing ones"""
+        names = {row['org_name'] for row in parsed_affiliations}
+        existing = {
+            name: (institution_id, country, city)
+            for name, institution_id, country, city in Institution.objects.filter(
+                name__in=names
+            ).values_list('name', 'id', 'country', 'city')
+        }
+        institution_ids = {name: values[0] for name, values in existing.items()}
+
+        new_institutions = []
+        stale_institutions = {}
+        now = timezone.now()
+        for row in parsed_affiliations:
+            name = row['org_name']
+            if name in existing:
+                institution_id, country, city = existing[name]
+                if (not country and row['country']) or (not city and row['city']):
+                    stale_institutions[institution_id] = Institution(
+                        id=institution_id,
+                        country=country or row['country'],
+                        city=city or row['city'],
+                        updated_at=now,
+                    )
+                    existing[name] = (institution_id, country or row['country'], city or row['city'])
+                continue
+            if name in institution_ids:
+                continue
+            institution = Institution(name=name, country=row['country'], city=row['city'])
+            institution_ids[name] = institution.id
+            new_institutions.append(institution)
+
+        # A concurrent sync may have inserted the same name since the SELECT above;
+        # the unique name skips those rows, so their stored ids are re-read
+        Institution.objects.bulk_create(new_institutions, batch_size=500, ignore_conflicts=True)
+        if new_institutions:
+            institution_ids.update(
+                Institution.objects.filter(
+                    name__in=[institution.name for institution in new_institutions]
+                ).values_list('name', 'id')
+            )
+        Institution.objects.bulk_update(
+            stale_institutions.values(), ['country', 'city', 'updated_at'], batch_size=500
+        )
+        return institution_ids
+
     def _process_funding(self, user, funding_data):
-        """Process funding information"""
+        """Process funding information, returning how many entries the ORCID record lists"""
         if not funding_data or 'group' not in funding_data:
-            return
+            return 0
+
+        # One funding per (user, title), as get_or_create used to enforce: stored
+        # entries are refreshed from ORCID in one bulk UPDATE, the rest inserted
+        existing = {funding.title: funding for funding in Funding.objects.filter(user=user)}
+        seen_titles = set()
+        new_funding = []
+        updated_funding = []
+        now = timezone.now()
 
         for group in funding_data['group']:
             for summary in group.get('funding-summary', []):
                 try:
-                    org_name = summary.get('organization', {}).get('name', 'Unknown Funder')
+                    title = _dig(summary, 'title', 'title', 'value', default='Unknown Grant')
+                    if title in seen_titles:
+                        continue
+
+                    org_name = _dig(summary, 'organization', 'name', default='Unknown Funder')
                     
                     # Parse dates
                     start_date = self._parse_orcid_date(summary.get('start-date'))
                     end_date = self._parse_orcid_date(summary.get('end-date'))
 
-                    Funding.objects.get_or_create(
-                        user=user,
-                        title=summary.get('title', {}).get('title', {}).get('value', 'Unknown Grant'),
-                        defaults={
-                            'funding_type': summary.get('type', 'grant'),
-                            'organization_name': org_name,
-                            'organization_country': summary.get('organization', {}).get('address', {}).get('country', ''),
-                            'start_date': start_date,
-                            'end_date': end_date,
-                            'url': summary.get('url', {}).get('value', '') if summary.get('url') else '',
-                            'orcid_put_code': str(summary.get('put-code', '')),
-                        }
-                    )
+                    fields = {
+                        'funding_type': summary.get('type', 'grant'),
+                        'organization_name': org_name,
+                        'organization_country': _dig(summary, 'organization', 'address', 'country'),
+                        'start_date': start_date,
+                        'end_date': end_date,
+                        'url': _dig(summary, 'url', 'value'),
+                        'orcid_put_code': str(summary.get('put-code', '')),
+                    }
+                    seen_titles.add(title)
+                    if title not in existing:
+                        new_funding.append(Funding(user=user, title=title, **fields))
+                    elif _refresh_fields(existing[title], fields):
+                        existing[title].updated_at = now
+                        updated_funding.append(existing[title])
 
                 except Exception as e:
                     self.stdout.write(f'⚠️  Warning: Could not process funding: {e}')
                     continue
 
+        Funding.objects.bulk_create(new_funding, batch_size=500, ignore_conflicts=True)
+        Funding.objects.bulk_update(updated_funding, [*FUNDING_ORCID_FIELDS, 'updated_at'], batch_size=500)
+        return len(seen_titles)
+
     def _process_publications(self, user, works_data, crossref_client, max_publications, skip_citations):
-        """Process publications and citations"""
+        """Process publications and citations, returning how many works were synced"""
         if not works_data or 'group' not in works_data:
             return 0
 
-        publications_created = 0
-        processed_count = 0
+        # First pass: parse up to max_publications distinct DOIs into Work field values
+        parsed_works = {}
 
         for group in works_data['group']:
-            if processed_count >= max_publications:
+            if len(parsed_works) >= max_publications:
                 break
 
             for work_summary in group.get('work-summary', []):
-                if processed_count >= max_publications:
+                if len(parsed_works) >= max_publications:
                     break
 
                 try:
                     # Extract DOI
                     doi = None
-                    external_ids = work_summary.get('external-ids', {}).get('external-id', [])
+                    external_ids = _dig(work_summary, 'external-ids', 'external-id', default=[])
                     for ext_id in external_ids:
                         if ext_id.get('external-id-type') == 'doi':
                             doi = ext_id.get('external-id-value')
                             break
 
-                    if not doi:
-                        continue  # Skip works without DOI
+                    # bulk_create skips Work.save, so DOIs are normalized and
+                    # title_short filled in here
+                    doi = doi.strip().lower() if doi else None
+                    if not doi or doi in parsed_works:
+                        continue  # Skip works without DOI or already seen
 
                     # Get publication date
                     pub_date = work_summary.get('publication-date')
@@ -298,125 +505,159 @@ class Command(BaseCommand):
                     
                     if pub_date and pub_date.get('year'):
                         pub_year = int(pub_date['year']['value'])
-                        month = int(pub_date.get('month', {}).get('value', 1)) if pub_date.get('month') else 1
-                        day = int(pub_date.get('day', {}).get('value', 1)) if pub_date.get('day') else 1
+                        month = int(_dig(pub_date, 'month', 'value', default=1))
+                        day = int(_dig(pub_date, 'day', 'value', default=1))
                         publication_date = date(pub_year, month, day)
 
-                    # Create work
-                    work, created = Work.objects.get_or_create(
-                        doi=doi,
-                        defaults={
-                            'title': work_summary.get('title', {}).get('title', {}).get('value', 'Unknown Title'),
-                            'work_type': work_summary.get('type', 'journal-article'),
-                            'journal_title': work_summary.get('journal-title', {}).get('value', '') if work_summary.get('journal-title') else '',
-                            'publication_date': publication_date,
-                            'publication_year': pub_year,
-                            'url': work_summary.get('url', {}).get('value', '') if work_summary.get('url') else '',
-                            'orcid_put_code': str(work_summary.get('put-code', '')),
-                        }
-                    )
-
-                    if created:
-                        publications_created += 1
-
-                    # Create work author relationship
-                    WorkAuthor.objects.get_or_create(
-                        work=work,
-                        user=user,
-                        defaults={
-                            'name': user.display_name or f"{user.first_name} {user.last_name}".strip(),
-                            'orcid_id': user.orcid_id,
-                            'author_order': 1,  # We don't have order info from ORCID summary
-                        }
-                    )
-
-                    # Note: Citation data will be fetched in bulk using get_citation_analysis()
-                    # This provides more accurate temporal citation data
-
-                    processed_count += 1
+                    title = _dig(work_summary, 'title', 'title', 'value', default='Unknown Title')
+                    parsed_works[doi] = {
+                        'doi': doi,
+                        'title': title,
+                        'title_short': Work.shorten_title(title),
+                        'work_type': work_summary.get('type', 'journal-article'),
+                        'journal_title': _dig(work_summary, 'journal-title', 'value'),
+                        'publication_date': publication_date,
+                        'publication_year': pub_year,
+                        'url': _dig(work_summary, 'url', 'value'),
+                        'orcid_put_code': str(work_summary.get('put-code', '')),
+                    }
 
                 except Exception as e:
                     self.stdout.write(f'⚠️  Warning: Could not process publication: {e}')
                     continue
 
-        return publications_created
+        if not parsed_works:
+            return 0
+
+        # Insert the works whose DOI is not stored yet; stored works whose ORCID
+        # metadata changed are refreshed in one bulk UPDATE
+        dois = list(parsed_works)
+        existing_works = {
+            work.doi: work
+            for work in Work.objects.filter(doi__in=dois).only('id', 'doi', *WORK_ORCID_FIELDS)
+        }
+        new_works = [Work(**fields) for doi, fields in parsed_works.items() if doi not in existing_works]
+        Work.objects.bulk_create(new_works, batch_size=500, ignore_conflicts=True)
+
+        updated_works = []
+        now = timezone.now()
+        for doi, work in existing_works.items():
+            if _refresh_fields(work, {field: parsed_works[doi][field] for field in WORK_ORCID_FIELDS}):
+                work.updated_at = now
+                updated_works.append(work)
+        Work.objects.bulk_update(updated_works, [*WORK_ORCID_FIELDS, 'updated_at'], batch_size=500)
+
+        # Re-read ids: rows skipped by ignore_conflicts keep their stored primary key
+        work_ids = dict(Work.objects.filter(doi__in=dois).values_list('doi', 'id'))
+
+        # Create work author relationships for works the user is not linked to yet.
+        # ORCID summaries carry no author order, so the user is placed after the
+        # authors a shared work already lists
+        linked_work_ids = set(
+            WorkAuthor.objects.filter(user=user, work_id__in=work_ids.values()).values_list('work_id', flat=True)
+        )
+        unlinked_work_ids = [work_id for work_id in work_ids.values() if work_id not in linked_work_ids]
+        last_orders = dict(
+            WorkAuthor.objects.filter(work_id__in=unlinked_work_ids)
+            .values('work_id').annotate(last_order=Max('author_order'))
+            .values_list('work_id', 'last_order')
+        )
+        author_name = user.display_name or f"{user.first_name} {user.last_name}".strip()
+        # Rows a concurrent sync inserted first clash on uniq_work_author_user or
+        # (work, author_order) and are skipped
+        WorkAuthor.objects.bulk_create(
+            [
+                WorkAuthor(
+                    work_id=work_id,
+                    user=user,
+                    name=author_name,
+                    orcid_id=user.orcid_id,
+                    author_order=last_orders.get(work_id, 0) + 1,
+                )
+                for work_id in unlinked_work_ids
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+
+        # Note: Citation data will be fetched in bulk using get_citation_analysis()
+        # This provides more accurate temporal citation data
+
+        # ignore_conflicts does not say which rows were skipped, so the links are counted
+        if not unlinked_work_ids:
+            return len(linked_work_ids)
+        return WorkAuthor.objects.filter(user=user, work_id__in=work_ids.values()).count()
 
     def _calculate_user_metrics(self, user):
         """Calculate and store user metrics"""
-        works = Work.objects.filter(authors__user=user)
-        total_publications = works.count()
+        # Semi-join on the user's WorkAuthor rows (served by the user+work index):
+        # each work counts once even if the user is listed twice as its author
+        works = Work.objects.filter(id__in=WorkAuthor.objects.filter(user=user).values('work'))
+        work_stats = works.aggregate(
+            total_publications=Count('id'),
+            work_citations=Sum('citation_count'),
+            max_citations=Max('citation_count'),
+            i10_index=Count('id', filter=Q(citation_count__gte=10)),
+            first_pub_year=Min('publication_year'),
+            last_pub_year=Max('publication_year'),
+        )
+        total_publications = work_stats['total_publications']
         
         # Get total citations from citation time series (more accurate)
-        citation_timeseries = CitationTimeSeries.objects.filter(user=user)
-        total_citations = sum(cts.citations_count for cts in citation_timeseries)
+        total_citations = CitationTimeSeries.objects.filter(user=user).aggregate(
+            total=Sum('citations_count')
+        )['total'] or 0
         
         # If no time series data, fall back to work citation counts
         if total_citations == 0:
-            total_citations = sum(work.citation_count for work in works)
-            citation_counts = sorted([work.citation_count for work in works], reverse=True)
-        else:
-            # For h-index calculation, we need individual paper citation counts
-            # This is a simplified approach - in reality we'd need per-paper citation data
-            citation_counts = sorted([work.citation_count for work in works], reverse=True)
-        
-        # Calculate h-index approximation
-        h_index = 0
-        for i, citations in enumerate(citation_counts, 1):
-            if citations >= i:
-                h_index = i
-            else:
-                break
+            total_citations = work_stats['work_citations'] or 0
+
+        # Calculate h-index approximation: rank papers by citations, most cited
+        # first; h is the number of papers whose citation count reaches their rank.
+        # Counts only decrease while ranks increase, so counting the matches in
+        # SQL gives h without pulling every citation count into Python
+        h_index = works.annotate(
+            citation_rank=Window(RowNumber(), order_by=F('citation_count').desc())
+        ).filter(citation_count__gte=F('citation_rank')).count()
 
         # Calculate i10-index (papers with at least 10 citations)
-        i10_index = sum(1 for count in citation_counts if count >= 10)
+        i10_index = work_stats['i10_index']
 
         # Calculate career span
-        pub_years = [work.publication_year for work in works if work.publication_year]
-        first_pub_year = min(pub_years) if pub_years else None
-        last_pub_year = max(pub_years) if pub_years else None
-        years_active = (last_pub_year - first_pub_year + 1) if first_pub_year and last_pub_year else 0
+        first_pub_year = work_stats['first_pub_year']
+        last_pub_year = work_stats['last_pub_year']
 
         # Update or create metrics
-        metrics, created = UserMetrics.objects.get_or_create(
+        UserMetrics.objects.update_or_create(
             user=user,
             defaults={
                 'total_publications': total_publications,
                 'total_citations': total_citations,
                 'h_index': h_index,
                 'i10_index': i10_index,
-                'years_active': years_active,
                 'first_publication_year': first_pub_year,
                 'last_publication_year': last_pub_year,
-                'avg_citations_per_paper': total_citations / total_publications if total_publications > 0 else 0,
-                'max_citations_single_paper': max(citation_counts) if citation_counts else 0,
+                'max_citations_single_paper': work_stats['max_citations'] or 0,
             }
         )
 
-        if not created:
-            # Update existing metrics
-            metrics.total_publications = total_publications
-            metrics.total_citations = total_citations
-            metrics.h_index = h_index
-            metrics.i10_index = i10_index
-            metrics.years_active = years_active
-            metrics.first_publication_year = first_pub_year
-            metrics.last_publication_year = last_pub_year
-            metrics.avg_citations_per_paper = total_citations / total_publications if total_publications > 0 else 0
-            metrics.max_citations_single_paper = max(citation_counts) if citation_counts else 0
-            metrics.save()
-
     def _store_citation_analysis(self, user, citation_analysis):
         """Store real citation analysis data from ORCID API"""
-        # Clear existing time series data
-        CitationTimeSeries.objects.filter(user=user).delete()
-        
-        # Store the real yearly citation data
-        for yearly_data in citation_analysis.get('yearly_data', []):
-            CitationTimeSeries.objects.create(
+        rows = [
+            CitationTimeSeries(
                 user=user,
                 year=yearly_data['year'],
                 citations_count=yearly_data['citations']
             )
+            for yearly_data in citation_analysis.get('yearly_data', [])
+        ]
+
+        with transaction.atomic():
+            # Clear existing time series data
+            CitationTimeSeries.objects.filter(user=user).delete()
+
+            # Store the real yearly citation data in a single multi-row INSERT
+            CitationTimeSeries.objects.bulk_create(rows, batch_size=500)
         
         self.stdout.write(f'   💾 Stored {len(citation_analysis.get("yearly_data", []))} years of citation data')
 
@@ -425,14 +666,8 @@ class Command(BaseCommand):
         if not date_info:
             return None
         
-        try:
-            year = int(date_info.get('year', {}).get('value', 0))
-            month = int(date_info.get('month', {}).get('value', 1))
-            day = int(date_info.get('day', {}).get('value', 1))
-            
-            if year > 0:
-                return date(year, month, day)
-        except (ValueError, TypeError):
-            pass
-        
-        return None 
\ No newline at end of file
+        return _parse_ymd(
+            _dig(date_info, 'year', 'value', default=0),
+            _dig(date_info, 'month', 'value', default=1),
+            _dig(date_info, 'day', 'value', default=1),
+        )
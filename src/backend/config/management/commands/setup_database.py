@@ -3,10 +3,28 @@ Django management command to set up the database with initial data
 Usage: python manage.py setup_database
 """
 
-from django.core.management.base import BaseCommand
-from django.db import transaction
-from config.models import Institution, ResearchArea
+from decouple import config
+from django.core.management.base import BaseCommand, OutputWrapper
+from django.db import connection, transaction
+import hashlib
+import io
 import json
+from pathlib import Path
+
+# Seed data lives in JSON files next to the app, not in this module
+SEED_DATA_DIR = Path(__file__).resolve().parents[2] / 'seed_data'
+
+
+def _load_seed_data(filename):
+    """Load a seed data file from config/seed_data, returning its data and SHA-256 fingerprint"""
+    raw = (SEED_DATA_DIR / filename).read_bytes()
+    return json.loads(raw), hashlib.sha256(raw).hexdigest()
+
+
+def _select_columns(table, *names):
+    """Rows of a {columns, rows} seed table as tuples of the named columns, in that order"""
+    indexes = [table['columns'].index(name) for name in names]
+    return [tuple(row[index] for index in indexes) for row in table['rows']]
 
 
 class Command(BaseCommand):
@@ -23,274 +41,223 @@ class Command(BaseCommand):
             action='store_true',
             help='Skip research areas setup',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=config('SETUP_DB_BATCH_SIZE', default=500, cast=int),
+            help='Rows per INSERT statement (default: SETUP_DB_BATCH_SIZE or 500)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-apply seed data even if it has not changed since the last run',
+        )
 
     def handle(self, *args, **options):
-        self.stdout.write(self.style.SUCCESS('Setting up initial database data...'))
+        # Models are imported here rather than at module level, so loading
+        # this command does not pull in config.models
+        from config.models import SeedVersion
 
+        # Output is buffered and written in one go
+        output = io.StringIO()
+        output.write(self.style.SUCCESS('Setting up initial database data...') + '\n')
+
+        # Fingerprints of the seed files already applied; unchanged files are skipped
+        self.applied = {} if options['force'] else dict(
+            SeedVersion.objects.values_list('name', 'fingerprint')
+        )
+
+        self.verbosity = options['verbosity']
+        self.batch_size = options['batch_size']
+
+        setups = []
         if not options['skip_institutions']:
-            self.setup_institutions()
-        
+            setups.append(self.setup_institutions)
         if not options['skip_research_areas']:
-            self.setup_research_areas()
+            setups.append(self.setup_research_areas)
+
+        # Every step and its seed fingerprint commit together in one transaction
+        try:
+            with transaction.atomic():
+                for setup in setups:
+                    self._run_setup(setup, OutputWrapper(output))
+        finally:
+            # Flushed even if a step fails, to show how far the setup got
+            self.stdout.write(output.getvalue(), ending='')
 
         self.stdout.write(self.style.SUCCESS('Database setup completed successfully!'))
 
-    @transaction.atomic
-    def setup_institutions(self):
+    def _run_setup(self, setup, out):
+        """Run one setup step and record the fingerprint of the seed file it applied"""
+        from config.models import SeedVersion
+
+        seed_version = setup(out)
+        if seed_version is not None:
+            SeedVersion.objects.bulk_create(
+                [seed_version],
+                update_conflicts=True,
+                unique_fields=['name'],
+                update_fields=['fingerprint', 'applied_at'],
+            )
+
+    def setup_institutions(self, out):
         """Set up initial institution data"""
-        self.stdout.write('Setting up institutions...')
+        from config.models import Institution
+
+        out.write('Setting up institutions...')
         
-        institutions_data = [
-            {
-                'name': 'Universidade de São Paulo',
-                'short_name': 'USP',
-                'country': 'Brazil',
-                'city': 'São Paulo',
-                'ror_id': 'https://ror.org/036rp1748',
-                'institution_type': 'university',
-                'website_url': 'https://www.usp.br/',
-                'established_year': 1934,
-            },
-            {
-                'name': 'Universidade Estadual de Campinas',
-                'short_name': 'UNICAMP',
-                'country': 'Brazil',
-                'city': 'Campinas',
-                'ror_id': 'https://ror.org/03yghzc09',
-                'institution_type': 'university',
-                'website_url': 'https://www.unicamp.br/',
-                'established_year': 1966,
-            },
-            {
-                'name': 'Massachusetts Institute of Technology',
-                'short_name': 'MIT',
-                'country': 'United States',
-                'city': 'Cambridge',
-                'ror_id': 'https://ror.org/042nb2s44',
-                'institution_type': 'university',
-                'website_url': 'https://www.mit.edu/',
-                'established_year': 1861,
-            },
-            {
-                'name': 'Stanford University',
-                'short_name': 'Stanford',
-                'country': 'United States',
-                'city': 'Stanford',
-                'ror_id': 'https://ror.org/00f54p054',
-                'institution_type': 'university',
-                'website_url': 'https://www.stanford.edu/',
-                'established_year': 1885,
-            },
-            {
-                'name': 'University of Oxford',
-                'short_name': 'Oxford',
-                'country': 'United Kingdom',
-                'city': 'Oxford',
-                'ror_id': 'https://ror.org/052gg0110',
-                'institution_type': 'university',
-                'website_url': 'https://www.ox.ac.uk/',
-                'established_year': 1096,
-            },
-            {
-                'name': 'University of Cambridge',
-                'short_name': 'Cambridge',
-                'country': 'United Kingdom',
-                'city': 'Cambridge',
-                'ror_id': 'https://ror.org/013meh722',
-                'institution_type': 'university',
-                'website_url': 'https://www.cam.ac.uk/',
-                'established_year': 1209,
-            },
-            {
-                'name': 'ETH Zurich',
-                'short_name': 'ETH',
-                'country': 'Switzerland',
-                'city': 'Zurich',
-                'ror_id': 'https://ror.org/05a28rw58',
-                'institution_type': 'university',
-                'website_url': 'https://ethz.ch/',
-                'established_year': 1855,
-            },
-            {
-                'name': 'CERN',
-                'short_name': 'CERN',
-                'country': 'Switzerland',
-                'city': 'Geneva',
-                'ror_id': 'https://ror.org/01ggx4157',
-                'institution_type': 'research_institute',
-                'website_url': 'https://home.cern/',
-                'established_year': 1954,
-            },
-        ]
+        # Seed tables are stored column-wise: one header and a plain list per row
+        institutions_table, fingerprint = _load_seed_data('institutions.json')
+        if self.applied.get('institutions') == fingerprint:
+            out.write('  Institutions already current, skipping.')
+            return
+        columns = institutions_table['columns']
+        rows = institutions_table['rows']
+        name_index = columns.index('name')
+
+        # One SELECT for the institutions already present, one INSERT for the rest
+        existing = Institution.objects.in_bulk([row[name_index] for row in rows], field_name='name')
+        to_create = [Institution(**dict(zip(columns, row))) for row in rows if row[name_index] not in existing]
+        Institution.objects.bulk_create(to_create, ignore_conflicts=True, batch_size=self.batch_size)
+        self.report_created(out, 'institutions', [institution.name for institution in to_create])
 
-        created_count = 0
-        for inst_data in institutions_data:
-            institution, created = Institution.objects.get_or_create(
-                name=inst_data['name'],
-                defaults=inst_data
+        # Only the seed fields that were corrected upstream are written, in one UPDATE
+        to_update = []
+        update_fields = set()
+        for row in rows:
+            institution = existing.get(row[name_index])
+            if institution is None:
+                continue
+            changed = [
+                (field, value) for field, value in zip(columns, row) if getattr(institution, field) != value
+            ]
+            if changed:
+                for field, value in changed:
+                    setattr(institution, field, value)
+                to_update.append(institution)
+                update_fields.update(field for field, _ in changed)
+        if to_update:
+            Institution.objects.bulk_update(
+                to_update, sorted(update_fields | {'updated_at'}), batch_size=self.batch_size
             )
-            if created:
-                created_count += 1
-                self.stdout.write(f'  Created: {institution.name}')
+        self.report_updated(out, 'institutions', [institution.name for institution in to_update])
 
-        self.stdout.write(
-            self.style.SUCCESS(f'Institutions setup complete. Created {created_count} new institutions.')
+        out.write(
+            self.style.SUCCESS(f'Institutions setup complete. Created {len(to_create)} new institutions.')
         )
+        return self.mark_applied('institutions', fingerprint)
 
-    @transaction.atomic
-    def setup_research_areas(self):
+    def setup_research_areas(self, out):
         """Set up initial research area taxonomy"""
-        self.stdout.write('Setting up research areas...')
+        from config.models import ResearchArea
+
+        out.write('Setting up research areas...')
         
-        # OECD Fields of Science and Technology classification
-        research_areas_data = [
-            # Level 1 - Major Fields
-            {
-                'name': 'Natural Sciences',
-                'description': 'Mathematics, computer and information sciences, physical sciences, chemical sciences, earth and related environmental sciences, biological sciences',
-                'subject_scheme': 'OECD FOS',
-                'parent': None,
-            },
-            {
-                'name': 'Engineering and Technology',
-                'description': 'Civil engineering, electrical engineering, electronic engineering, information engineering, mechanical engineering, chemical engineering, materials engineering, medical engineering, environmental engineering, environmental biotechnology, industrial biotechnology, nano-technology',
-                'subject_scheme': 'OECD FOS',
-                'parent': None,
-            },
-            {
-                'name': 'Medical and Health Sciences',
-                'description': 'Basic medicine, clinical medicine, health sciences, health biotechnology',
-                'subject_scheme': 'OECD FOS',
-                'parent': None,
-            },
-            {
-                'name': 'Agricultural Sciences',
-                'description': 'Agriculture, forestry, and fisheries, animal and dairy science, veterinary science, agricultural biotechnology',
-                'subject_scheme': 'OECD FOS',
-                'parent': None,
-            },
-            {
-                'name': 'Social Sciences',
-                'description': 'Psychology, economics and business, educational sciences, sociology, law, political science, social and economic geography, media and communications',
-                'subject_scheme': 'OECD FOS',
-                'parent': None,
-            },
-            {
-                'name': 'Humanities',
-                'description': 'History and archaeology, languages and literature, philosophy, ethics and religion, arts',
-                'subject_scheme': 'OECD FOS',
-                'parent': None,
-            },
-        ]
+        # OECD Fields of Science and Technology classification:
+        # Level 1 major fields and Level 2 subfields
+        taxonomy, fingerprint = _load_seed_data('research_areas.json')
+        if self.applied.get('research_areas') == fingerprint:
+            out.write('  Research areas already current, skipping.')
+            return
+        research_areas_data = _select_columns(taxonomy['major_fields'], 'name', 'description', 'subject_scheme')
+        subfields_data = _select_columns(taxonomy['subfields'], 'name', 'description', 'parent')
+
+        # One SELECT finds every area of either level that is already seeded
+        existing_areas = ResearchArea.objects.in_bulk(
+            [row[0] for row in research_areas_data + subfields_data],
+            field_name='name',
+        )
+
+        major_fields = {
+            name: ResearchArea(
+                name=name,
+                description=description,
+                subject_scheme=subject_scheme,
+                parent=None,
+            )
+            for name, description, subject_scheme in research_areas_data
+        }
+        self._keep_existing_pks(major_fields.values(), existing_areas)
 
-        # Create major fields first
-        major_fields = {}
-        for area_data in research_areas_data:
-            area, created = ResearchArea.objects.get_or_create(
-                name=area_data['name'],
-                defaults={
-                    'description': area_data['description'],
-                    'subject_scheme': area_data['subject_scheme'],
-                    'parent': None,
-                }
+        # Subfields point at their major field through parent_id directly,
+        # skipping the related-object descriptor for every row
+        parent_ids = {name: area.pk for name, area in major_fields.items()}
+        subfields = [
+            ResearchArea(
+                name=name,
+                description=description,
+                subject_scheme='OECD FOS',
+                parent_id=parent_ids[parent],
             )
-            major_fields[area_data['name']] = area
-            if created:
-                self.stdout.write(f'  Created major field: {area.name}')
-
-        # Level 2 - Subfields
-        subfields_data = [
-            # Natural Sciences subfields
-            {
-                'name': 'Computer Science',
-                'description': 'Algorithms, artificial intelligence, computer systems, software engineering',
-                'parent': 'Natural Sciences',
-            },
-            {
-                'name': 'Mathematics',
-                'description': 'Pure mathematics, applied mathematics, statistics and probability',
-                'parent': 'Natural Sciences',
-            },
-            {
-                'name': 'Physics',
-                'description': 'Theoretical physics, applied physics, condensed matter physics',
-                'parent': 'Natural Sciences',
-            },
-            {
-                'name': 'Chemistry',
-                'description': 'Organic chemistry, inorganic chemistry, physical chemistry',
-                'parent': 'Natural Sciences',
-            },
-            {
-                'name': 'Biology',
-                'description': 'Molecular biology, cell biology, genetics, ecology',
-                'parent': 'Natural Sciences',
-            },
-            
-            # Engineering subfields
-            {
-                'name': 'Software Engineering',
-                'description': 'Software development, systems analysis, programming methodologies',
-                'parent': 'Engineering and Technology',
-            },
-            {
-                'name': 'Electrical Engineering',
-                'description': 'Electronics, telecommunications, power systems',
-                'parent': 'Engineering and Technology',
-            },
-            {
-                'name': 'Mechanical Engineering',
-                'description': 'Thermodynamics, fluid mechanics, materials science',
-                'parent': 'Engineering and Technology',
-            },
-            
-            # Medical Sciences subfields
-            {
-                'name': 'Clinical Medicine',
-                'description': 'Internal medicine, surgery, pediatrics, psychiatry',
-                'parent': 'Medical and Health Sciences',
-            },
-            {
-                'name': 'Biomedical Research',
-                'description': 'Pharmacology, pathology, immunology',
-                'parent': 'Medical and Health Sciences',
-            },
-            
-            # Social Sciences subfields
-            {
-                'name': 'Psychology',
-                'description': 'Cognitive psychology, social psychology, developmental psychology',
-                'parent': 'Social Sciences',
-            },
-            {
-                'name': 'Economics',
-                'description': 'Microeconomics, macroeconomics, econometrics',
-                'parent': 'Social Sciences',
-            },
-            {
-                'name': 'Education',
-                'description': 'Educational psychology, curriculum development, educational technology',
-                'parent': 'Social Sciences',
-            },
+            for name, description, parent in subfields_data
+            if parent in parent_ids
         ]
 
-        created_subfields = 0
-        for subfield_data in subfields_data:
-            parent_area = major_fields.get(subfield_data['parent'])
-            if parent_area:
-                subfield, created = ResearchArea.objects.get_or_create(
-                    name=subfield_data['name'],
-                    defaults={
-                        'description': subfield_data['description'],
-                        'subject_scheme': 'OECD FOS',
-                        'parent': parent_area,
-                    }
-                )
-                if created:
-                    created_subfields += 1
-                    self.stdout.write(f'  Created subfield: {subfield.name} (under {parent_area.name})')
-
-        total_areas = len(research_areas_data) + created_subfields
-        self.stdout.write(
+        # Both levels go in one INSERT ... ON CONFLICT (name) DO UPDATE. UUID primary
+        # keys are assigned client-side, so parent ids are known before the insert;
+        # major fields come first and the foreign key is checked once the statement ends
+        self._keep_existing_pks(subfields, existing_areas)
+        areas = [*major_fields.values(), *subfields]
+        ResearchArea.objects.bulk_create(
+            areas,
+            batch_size=self.batch_size,
+            **self._upsert_options(['name'], ['description', 'subject_scheme', 'parent']),
+        )
+        self.report_created(
+            out, 'major fields', [name for name in major_fields if name not in existing_areas]
+        )
+        self.report_created(
+            out,
+            'subfields',
+            [
+                f'{name} (under {parent})'
+                for name, _, parent in subfields_data
+                if parent in parent_ids and name not in existing_areas
+            ],
+        )
+
+        total_areas = len(major_fields) + len(subfields)
+        out.write(
             self.style.SUCCESS(f'Research areas setup complete. Total areas: {total_areas}')
-        ) 
\ No newline at end of file
+        )
+        return self.mark_applied('research_areas', fingerprint)
+
+    def _upsert_options(self, unique_fields, update_fields):
+        """bulk_create options that update seeded rows in place where the backend supports it"""
+        if connection.features.supports_update_conflicts_with_target:
+            return {
+                'update_conflicts': True,
+                'unique_fields': unique_fields,
+                'update_fields': update_fields,
+            }
+        return {'ignore_conflicts': True}
+
+    def _keep_existing_pks(self, areas, existing_areas):
+        """Reuse the primary keys of seeded rows, so upserted instances stay valid as parents"""
+        for area in areas:
+            if area.name in existing_areas:
+                area.pk = existing_areas[area.name].pk
+
+    def report_created(self, out, label, names):
+        """Write one summary line per seed step; names are listed from verbosity 2 up"""
+        if not names:
+            return
+        if self.verbosity >= 2:
+            out.write(f'  Created {len(names)} {label}: {", ".join(names)}')
+        else:
+            out.write(f'  Created {len(names)} {label}')
+
+    def report_updated(self, out, label, names):
+        """Write one summary line for seeded rows refreshed from corrected seed data"""
+        if not names:
+            return
+        if self.verbosity >= 2:
+            out.write(f'  Updated {len(names)} {label}: {", ".join(names)}')
+        else:
+            out.write(f'  Updated {len(names)} {label}')
+
+    def mark_applied(self, name, fingerprint):
+        """Fingerprint record of a seed file, saved by _run_setup along with the seed data"""
+        from config.models import SeedVersion
+
+        return SeedVersion(name=name, fingerprint=fingerprint)
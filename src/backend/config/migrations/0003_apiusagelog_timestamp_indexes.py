@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0002_add_social_media_accounts'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='apiusagelog',
+            name='api_usage_l_endpoin_133785_idx',
+        ),
+        migrations.AddIndex(
+            model_name='apiusagelog',
+            index=models.Index(fields=['endpoint', 'timestamp'], name='api_usage_l_endpoin_bc57dc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='apiusagelog',
+            index=models.Index(fields=['-timestamp'], name='api_usage_l_timesta_cd2738_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+"""
+Trigram GIN indexes backing the admin search_fields.
+
+Django turns search_fields into ILIKE '%term%' filters, which a btree index
+cannot serve. On PostgreSQL, pg_trgm GIN indexes can, so the existing admin
+searches become index scans without changing any query. Other backends
+(SQLite in development) are left untouched.
+"""
+
+from django.db import migrations
+
+
+TRIGRAM_INDEXES = [
+    ('institutions_name_trgm_idx', 'institutions', 'name'),
+    ('works_title_trgm_idx', 'works', 'title'),
+    ('work_authors_name_trgm_idx', 'work_authors', 'name'),
+    ('funding_organization_name_trgm_idx', 'funding', 'organization_name'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0003_apiusagelog_timestamp_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0004_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrossrefCitationCache',
+            fields=[
+                ('doi', models.CharField(max_length=200, primary_key=True, serialize=False)),
+                ('citation_count', models.IntegerField(default=0)),
+                ('fetched_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'crossref_citation_cache',
+                'indexes': [models.Index(fields=['fetched_at'], name='crossref_ci_fetched_5b63d2_idx')],
+            },
+        ),
+    ]
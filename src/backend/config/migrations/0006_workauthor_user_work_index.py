@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0005_crossrefcitationcache'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='workauthor',
+            name='work_author_user_id_e4db4d_idx',
+        ),
+        migrations.AddIndex(
+            model_name='workauthor',
+            index=models.Index(fields=['user', 'work'], name='work_author_user_id_825b4d_idx'),
+        ),
+    ]
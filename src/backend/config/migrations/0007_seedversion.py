@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0006_workauthor_user_work_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeedVersion',
+            fields=[
+                ('name', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('fingerprint', models.CharField(help_text='SHA-256 of the seed data file', max_length=64)),
+                ('applied_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'seed_versions',
+            },
+        ),
+    ]
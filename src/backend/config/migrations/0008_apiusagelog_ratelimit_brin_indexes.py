@@ -0,0 +1,40 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:52
+
+from django.db import migrations, models
+
+
+# Log rows are appended in timestamp order, so a BRIN index (a few pages of
+# per-block min/max ranges) serves time-window scans. PostgreSQL only, like the
+# trigram indexes in 0004
+def create_timestamp_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS api_usage_logs_timestamp_brin_idx '
+        'ON api_usage_logs USING brin (timestamp)'
+    )
+
+
+def drop_timestamp_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS api_usage_logs_timestamp_brin_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0007_seedversion'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='apiusagelog',
+            name='api_usage_l_rate_li_9408f9_idx',
+        ),
+        migrations.AddIndex(
+            model_name='apiusagelog',
+            index=models.Index(condition=models.Q(('status_code__lt', 500)), fields=['rate_limit_key', '-timestamp'], name='apilog_ratelimit_recent'),
+        ),
+        migrations.RunPython(create_timestamp_brin_index, drop_timestamp_brin_index),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:53
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def copy_tokens_to_side_table(apps, schema_editor):
+    User = apps.get_model('config', 'User')
+    UserOrcidToken = apps.get_model('config', 'UserOrcidToken')
+    tokens = [
+        UserOrcidToken(
+            user_id=user_id,
+            access_token=access_token,
+            refresh_token=refresh_token or '',
+            expires_at=expires_at,
+        )
+        for user_id, access_token, refresh_token, expires_at in User.objects.exclude(
+            orcid_access_token__isnull=True
+        ).exclude(orcid_access_token='').values_list(
+            'id', 'orcid_access_token', 'orcid_refresh_token', 'orcid_token_expires_at'
+        ).iterator()
+    ]
+    UserOrcidToken.objects.bulk_create(tokens, batch_size=1000)
+
+
+def copy_tokens_to_users(apps, schema_editor):
+    User = apps.get_model('config', 'User')
+    UserOrcidToken = apps.get_model('config', 'UserOrcidToken')
+    users = []
+    for token in UserOrcidToken.objects.iterator():
+        users.append(User(
+            id=token.user_id,
+            orcid_access_token=token.access_token,
+            orcid_refresh_token=token.refresh_token,
+            orcid_token_expires_at=token.expires_at,
+        ))
+    User.objects.bulk_update(
+        users, ['orcid_access_token', 'orcid_refresh_token', 'orcid_token_expires_at'], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0008_apiusagelog_ratelimit_brin_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserOrcidToken',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='orcid_token', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('access_token', models.TextField(help_text='Encrypted ORCID access token')),
+                ('refresh_token', models.TextField(blank=True, help_text='Encrypted ORCID refresh token')),
+                ('expires_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'user_orcid_tokens',
+            },
+        ),
+        migrations.RunPython(copy_tokens_to_side_table, copy_tokens_to_users),
+        migrations.RemoveField(
+            model_name='user',
+            name='orcid_access_token',
+        ),
+        migrations.RemoveField(
+            model_name='user',
+            name='orcid_refresh_token',
+        ),
+        migrations.RemoveField(
+            model_name='user',
+            name='orcid_token_expires_at',
+        ),
+    ]
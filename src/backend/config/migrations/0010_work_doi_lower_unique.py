@@ -0,0 +1,30 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:54
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def lowercase_existing_dois(apps, schema_editor):
+    Work = apps.get_model('config', 'Work')
+    Work.objects.filter(doi='').update(doi=None)
+    Work.objects.exclude(doi__isnull=True).update(doi=django.db.models.functions.text.Lower('doi'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0009_user_orcid_tokens'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='work',
+            name='doi',
+            field=models.CharField(blank=True, help_text='Stored lowercased', max_length=200, null=True),
+        ),
+        migrations.RunPython(lowercase_existing_dois, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='work',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('doi'), name='works_doi_lower_uniq'),
+        ),
+    ]
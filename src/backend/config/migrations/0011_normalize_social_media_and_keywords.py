@@ -0,0 +1,118 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:55
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+from django.utils.dateparse import parse_datetime
+
+
+BATCH_SIZE = 1000
+
+
+def flatten_json_columns(apps, schema_editor):
+    User = apps.get_model('config', 'User')
+    Work = apps.get_model('config', 'Work')
+    SocialMediaAccount = apps.get_model('config', 'SocialMediaAccount')
+    WorkKeyword = apps.get_model('config', 'WorkKeyword')
+
+    # One row per (user, platform); a later entry for the same platform wins, as it did in the JSON list
+    accounts = []
+    for user_id, entries in User.objects.values_list('id', 'social_media_accounts').iterator():
+        by_platform = {}
+        for entry in entries or []:
+            platform = (entry.get('platform') or '').lower()
+            if platform and entry.get('username'):
+                by_platform[platform] = entry
+        for platform, entry in by_platform.items():
+            added_at = parse_datetime(entry.get('added_at') or '')
+            accounts.append(SocialMediaAccount(
+                user_id=user_id,
+                platform=platform,
+                username=entry['username'],
+                url=entry.get('url') or '',
+                **({'added_at': added_at} if added_at else {}),
+            ))
+    SocialMediaAccount.objects.bulk_create(accounts, batch_size=BATCH_SIZE)
+
+    keywords = []
+    for work_id, entries in Work.objects.values_list('id', 'keywords').iterator():
+        for keyword in dict.fromkeys(str(entry).strip()[:200] for entry in entries or []):
+            if keyword:
+                keywords.append(WorkKeyword(work_id=work_id, keyword=keyword))
+    WorkKeyword.objects.bulk_create(keywords, batch_size=BATCH_SIZE, ignore_conflicts=True)
+
+
+def rebuild_json_columns(apps, schema_editor):
+    User = apps.get_model('config', 'User')
+    Work = apps.get_model('config', 'Work')
+    SocialMediaAccount = apps.get_model('config', 'SocialMediaAccount')
+    WorkKeyword = apps.get_model('config', 'WorkKeyword')
+
+    accounts_by_user = {}
+    for account in SocialMediaAccount.objects.order_by('added_at').iterator():
+        accounts_by_user.setdefault(account.user_id, []).append({
+            'platform': account.platform,
+            'username': account.username,
+            'url': account.url,
+            'added_at': account.added_at.isoformat(),
+        })
+    # The reverse relations share the JSON fields' names, so instances cannot be
+    # built with them; update() resolves the concrete field instead
+    for user_id, accounts in accounts_by_user.items():
+        User.objects.filter(id=user_id).update(social_media_accounts=accounts)
+
+    keywords_by_work = {}
+    for work_id, keyword in WorkKeyword.objects.values_list('work_id', 'keyword').iterator():
+        keywords_by_work.setdefault(work_id, []).append(keyword)
+    for work_id, keywords in keywords_by_work.items():
+        Work.objects.filter(id=work_id).update(keywords=keywords)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0010_work_doi_lower_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SocialMediaAccount',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('platform', models.CharField(help_text='Lowercased platform name, e.g. twitter', max_length=50)),
+                ('username', models.CharField(max_length=255)),
+                ('url', models.URLField(blank=True, max_length=500)),
+                ('added_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='social_media_accounts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'social_media_accounts',
+                'indexes': [models.Index(fields=['platform', 'username'], name='social_medi_platfor_60059d_idx')],
+                'unique_together': {('user', 'platform')},
+            },
+        ),
+        migrations.CreateModel(
+            name='WorkKeyword',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('keyword', models.CharField(max_length=200)),
+                ('work', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keywords', to='config.work')),
+            ],
+            options={
+                'db_table': 'work_keywords',
+                'indexes': [models.Index(fields=['keyword'], name='work_keywor_keyword_7d4b93_idx')],
+                'unique_together': {('work', 'keyword')},
+            },
+        ),
+        migrations.RunPython(flatten_json_columns, rebuild_json_columns),
+        migrations.RemoveField(
+            model_name='user',
+            name='social_media_accounts',
+        ),
+        migrations.RemoveField(
+            model_name='work',
+            name='keywords',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:57
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0011_normalize_social_media_and_keywords'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='collaborationnetwork',
+            name='shared_works',
+        ),
+    ]
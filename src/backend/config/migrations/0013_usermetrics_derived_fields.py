@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:58
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0012_remove_collaborationnetwork_shared_works'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='usermetrics',
+            name='avg_citations_per_paper',
+        ),
+        migrations.RemoveField(
+            model_name='usermetrics',
+            name='years_active',
+        ),
+    ]
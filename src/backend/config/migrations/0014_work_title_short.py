@@ -0,0 +1,33 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:40
+
+from django.db import migrations, models
+from django.db.models import Case, CharField, Value, When
+from django.db.models.functions import Concat, Length, Substr
+from django.db.models.lookups import GreaterThan
+
+
+def populate_title_short(apps, schema_editor):
+    Work = apps.get_model('config', 'Work')
+    Work.objects.update(title_short=Case(
+        When(GreaterThan(Length('title'), 100),
+             then=Concat(Substr('title', 1, 100), Value('...'), output_field=CharField())),
+        default='title',
+        output_field=CharField(),
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0013_usermetrics_derived_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='work',
+            name='title_short',
+            field=models.CharField(default='', editable=False, help_text='First 100 characters of the title, set on save', max_length=103),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_title_short, migrations.RunPython.noop),
+    ]
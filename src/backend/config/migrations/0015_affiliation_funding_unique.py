@@ -0,0 +1,54 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:00
+
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+
+
+def _delete_duplicates(model, key_fields):
+    # Keeps the most recently updated row of each key; rows with a NULL or
+    # blank key column never conflict and are left alone
+    seen = set()
+    duplicate_ids = []
+    rows = model.objects.order_by('-updated_at').values_list('id', *key_fields)
+    for row_id, *key in rows.iterator():
+        if any(value is None or value == '' for value in key):
+            continue
+        if tuple(key) in seen:
+            duplicate_ids.append(row_id)
+        else:
+            seen.add(tuple(key))
+    for start in range(0, len(duplicate_ids), BATCH_SIZE):
+        model.objects.filter(id__in=duplicate_ids[start:start + BATCH_SIZE]).delete()
+
+
+def delete_duplicate_rows(apps, schema_editor):
+    Affiliation = apps.get_model('config', 'Affiliation')
+    Funding = apps.get_model('config', 'Funding')
+    _delete_duplicates(Affiliation, ['user_id', 'institution_id', 'affiliation_type', 'start_date'])
+    _delete_duplicates(Affiliation, ['user_id', 'orcid_put_code'])
+    _delete_duplicates(Funding, ['user_id', 'orcid_put_code'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0014_work_title_short'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_rows, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='affiliation',
+            constraint=models.UniqueConstraint(fields=('user', 'institution', 'affiliation_type', 'start_date'), name='uniq_affil'),
+        ),
+        migrations.AddConstraint(
+            model_name='affiliation',
+            constraint=models.UniqueConstraint(condition=models.Q(('orcid_put_code__gt', '')), fields=('user', 'orcid_put_code'), name='uniq_affil_put'),
+        ),
+        migrations.AddConstraint(
+            model_name='funding',
+            constraint=models.UniqueConstraint(condition=models.Q(('orcid_put_code__gt', '')), fields=('user', 'orcid_put_code'), name='uniq_funding_put'),
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:00
+
+import config.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0015_affiliation_funding_unique'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='affiliation',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='apiusagelog',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='citation',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='citationtimeseries',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='collaborationnetwork',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='funding',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='institution',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='researcharea',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='socialmediaaccount',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='usermetrics',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='userresearcharea',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='work',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='workauthor',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='workkeyword',
+            name='id',
+            field=models.UUIDField(default=config.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('config', '0016_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='orcid_id',
+            field=models.CharField(blank=True, help_text='16-digit ORCID identifier', max_length=19, null=True, unique=True),
+        ),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.CheckConstraint(condition=models.Q(('orcid_id__regex', '^\\d{4}-\\d{4}-\\d{4}-\\d{3}[\\dX]$'), ('orcid_id__isnull', True), _connector='OR'), name='valid_orcid_format', violation_error_message='Invalid ORCID ID format. Should be: 0000-0000-0000-000X'),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:05
+
+from django.db import migrations
+from django.utils import timezone
+
+from config.partitions import (
+    DEFAULT_PARTITION, PARENT_TABLE, add_months, ensure_partitions, month_start,
+)
+
+# Months created ahead of the current one; manage_api_usage_partitions keeps this up
+PARTITIONS_AHEAD = 3
+OLD_TABLE = f'{PARENT_TABLE}_old'
+
+
+def _table_ddl(cursor, table):
+    """Primary key name, index DDL and foreign key DDL of a table"""
+    cursor.execute(
+        "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'", [table]
+    )
+    primary_key = cursor.fetchone()[0]
+    cursor.execute(
+        'SELECT pg_get_indexdef(indexrelid) FROM pg_index WHERE indrelid = %s::regclass AND NOT indisprimary',
+        [table],
+    )
+    # "ON ONLY" marks an index of a partitioned table; plain CREATE INDEX works for both kinds
+    index_ddl = [row[0].replace(' ON ONLY ', ' ON ') for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'",
+        [table],
+    )
+    return primary_key, index_ddl, cursor.fetchall()
+
+
+def _rebuild_table(cursor, partitioned):
+    """Recreate api_usage_logs as a partitioned or plain table, copying its rows, indexes and foreign keys"""
+    primary_key, index_ddl, foreign_keys = _table_ddl(cursor, PARENT_TABLE)
+    cursor.execute(f'ALTER TABLE {PARENT_TABLE} RENAME CONSTRAINT {primary_key} TO {OLD_TABLE}_pkey')
+    cursor.execute(f'ALTER TABLE {PARENT_TABLE} RENAME TO {OLD_TABLE}')
+
+    if partitioned:
+        cursor.execute(
+            f'CREATE TABLE {PARENT_TABLE} (LIKE {OLD_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE ("timestamp")'
+        )
+        # Unique keys of a partitioned table must include the partition column
+        cursor.execute(f'ALTER TABLE {PARENT_TABLE} ADD CONSTRAINT {primary_key} PRIMARY KEY (id, "timestamp")')
+        cursor.execute(f'CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT')
+        cursor.execute(f'SELECT min("timestamp") FROM {OLD_TABLE}')
+        now = timezone.now()
+        ensure_partitions(cursor, cursor.fetchone()[0] or now, add_months(month_start(now), PARTITIONS_AHEAD))
+    else:
+        cursor.execute(f'CREATE TABLE {PARENT_TABLE} (LIKE {OLD_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+        cursor.execute(f'ALTER TABLE {PARENT_TABLE} ADD CONSTRAINT {primary_key} PRIMARY KEY (id)')
+
+    cursor.execute(f'INSERT INTO {PARENT_TABLE} SELECT * FROM {OLD_TABLE}')
+    # Drops the old partitions too; index and constraint names are free again afterwards
+    cursor.execute(f'DROP TABLE {OLD_TABLE}')
+    for ddl in index_ddl:
+        cursor.execute(ddl)
+    for name, definition in foreign_keys:
+        cursor.execute(f'ALTER TABLE {PARENT_TABLE} ADD CONSTRAINT {name} {definition}')
+
+
+def partition_api_usage_logs(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        _rebuild_table(cursor, partitioned=True)
+
+
+def unpartition_api_usage_logs(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        _rebuild_table(cursor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0017_user_orcid_id_check'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_api_usage_logs, unpartition_api_usage_logs),
+    ]
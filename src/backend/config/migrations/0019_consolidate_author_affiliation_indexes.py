@@ -0,0 +1,62 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0018_partition_api_usage_logs'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='affiliation',
+            name='affiliation_institu_c7015d_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='affiliation',
+            name='affiliation_is_curr_f0e4e3_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='workauthor',
+            name='work_author_work_id_694594_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='workauthor',
+            name='work_author_orcid_i_8d85f0_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='workauthor',
+            name='work_author_user_id_825b4d_idx',
+        ),
+        migrations.AlterField(
+            model_name='affiliation',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='affiliations', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='workauthor',
+            name='user',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='authored_works', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='workauthor',
+            name='work',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='authors', to='config.work'),
+        ),
+        migrations.AddIndex(
+            model_name='affiliation',
+            index=models.Index(condition=models.Q(('is_current', True)), fields=['is_current'], name='affil_current'),
+        ),
+        migrations.AddIndex(
+            model_name='workauthor',
+            index=models.Index(condition=models.Q(('user__isnull', False)), fields=['user', 'work'], name='wa_user_nn'),
+        ),
+        migrations.AddIndex(
+            model_name='workauthor',
+            index=models.Index(condition=models.Q(('orcid_id__gt', '')), fields=['orcid_id'], name='wa_orcid_nn'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0019_consolidate_author_affiliation_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userorcidtoken',
+            name='access_token',
+            field=models.TextField(),
+        ),
+        migrations.AlterField(
+            model_name='userorcidtoken',
+            name='refresh_token',
+            field=models.TextField(blank=True),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:22
+
+from django.db import migrations, models
+
+
+def merge_duplicate_institutions(apps, schema_editor):
+    # Keeps the oldest institution of each name and moves the affiliations of
+    # the others onto it; an affiliation the kept institution already has for
+    # the same user, type and start date is dropped instead of moved
+    Institution = apps.get_model('config', 'Institution')
+    Affiliation = apps.get_model('config', 'Affiliation')
+
+    kept = {}
+    duplicates = {}
+    for institution_id, name in Institution.objects.order_by('created_at', 'id').values_list('id', 'name').iterator():
+        if name in kept:
+            duplicates[institution_id] = kept[name]
+        else:
+            kept[name] = institution_id
+    if not duplicates:
+        return
+
+    for affiliation in Affiliation.objects.filter(institution_id__in=duplicates).order_by('-updated_at'):
+        target_id = duplicates[affiliation.institution_id]
+        clash = affiliation.start_date is not None and Affiliation.objects.filter(
+            user_id=affiliation.user_id,
+            institution_id=target_id,
+            affiliation_type=affiliation.affiliation_type,
+            start_date=affiliation.start_date,
+        ).exists()
+        if clash:
+            affiliation.delete()
+        else:
+            Affiliation.objects.filter(id=affiliation.id).update(institution_id=target_id)
+    Institution.objects.filter(id__in=duplicates).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0020_userorcidtoken_help_text'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_institutions, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='institution',
+            name='institution_name_e35db9_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='institution',
+            constraint=models.UniqueConstraint(fields=('name',), name='uniq_institution_name'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:23
+
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+
+
+def delete_duplicate_user_links(apps, schema_editor):
+    # Keeps the first row linking a user to a work; rows with no user never conflict
+    WorkAuthor = apps.get_model('config', 'WorkAuthor')
+    seen = set()
+    duplicate_ids = []
+    rows = WorkAuthor.objects.filter(user__isnull=False).order_by('created_at', 'id').values_list(
+        'id', 'user_id', 'work_id'
+    )
+    for row_id, user_id, work_id in rows.iterator():
+        if (user_id, work_id) in seen:
+            duplicate_ids.append(row_id)
+        else:
+            seen.add((user_id, work_id))
+    for start in range(0, len(duplicate_ids), BATCH_SIZE):
+        WorkAuthor.objects.filter(id__in=duplicate_ids[start:start + BATCH_SIZE]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('config', '0021_institution_name_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_user_links, migrations.RunPython.noop),
+        # The unique index takes over the lookups of the plain one it replaces
+        migrations.AddConstraint(
+            model_name='workauthor',
+            constraint=models.UniqueConstraint(condition=models.Q(('user__isnull', False)), fields=('user', 'work'), name='uniq_work_author_user'),
+        ),
+        migrations.RemoveIndex(
+            model_name='workauthor',
+            name='wa_user_nn',
+        ),
+    ]
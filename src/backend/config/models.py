@@ -3,47 +3,45 @@ Database models for ORCID Research Platform
 """
 
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
-from django.core.validators import RegexValidator
+from django.utils import timezone
+import os
+import time
 import uuid
 
 
+def uuid7():
+    """
+    Time-ordered UUID (RFC 9562 version 7): a 48-bit millisecond timestamp
+    followed by random bits. New primary keys sort after existing ones, so
+    inserts append to the right edge of the index instead of a random page
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = value & ~(0xF << 76) | 0x7 << 76  # version
+    value = value & ~(0x3 << 62) | 0x2 << 62  # variant
+    return uuid.UUID(int=value)
+
+
 class User(AbstractUser):
     """
     Extended User model with ORCID integration
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     email = models.EmailField(blank=True, null=True)  # Override AbstractUser email to allow null
     orcid_id = models.CharField(
         max_length=19,
         unique=True,
         null=True,
         blank=True,
-        validators=[
-            RegexValidator(
-                regex=r'^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$',
-                message='Invalid ORCID ID format. Should be: 0000-0000-0000-000X'
-            )
-        ],
         help_text='16-digit ORCID identifier'
     )
-    orcid_access_token = models.TextField(null=True, blank=True, help_text='Encrypted ORCID access token')
-    orcid_refresh_token = models.TextField(null=True, blank=True, help_text='Encrypted ORCID refresh token')
-    orcid_token_expires_at = models.DateTimeField(null=True, blank=True)
-    
     # Profile information
     display_name = models.CharField(max_length=255, blank=True)
     biography = models.TextField(blank=True)
     profile_picture_url = models.URLField(blank=True)
     website_url = models.URLField(blank=True)
     
-    # Social media accounts
-    social_media_accounts = models.JSONField(
-        default=list, 
-        blank=True,
-        help_text='List of social media accounts: [{"platform": "twitter", "username": "johndoe", "url": "https://twitter.com/johndoe"}]'
-    )
-    
     # Privacy settings
     profile_public = models.BooleanField(default=True)
     show_publications = models.BooleanField(default=True)
@@ -61,16 +59,64 @@ class User(AbstractUser):
             models.Index(fields=['orcid_id']),
             models.Index(fields=['created_at']),
         ]
+        constraints = [
+            # Checked by the database on every write, bulk_create included; full_clean
+            # still reports it as a validation error through validate_constraints
+            models.CheckConstraint(
+                condition=models.Q(orcid_id__regex=r'^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$') | models.Q(orcid_id__isnull=True),
+                name='valid_orcid_format',
+                violation_error_message='Invalid ORCID ID format. Should be: 0000-0000-0000-000X',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.username} ({self.orcid_id or 'No ORCID'})"
 
 
+class UserOrcidToken(models.Model):
+    """
+    ORCID OAuth tokens, kept apart from the users table so user rows stay narrow
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='orcid_token')
+    access_token = models.TextField()
+    refresh_token = models.TextField(blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'user_orcid_tokens'
+
+    def __str__(self):
+        return f"ORCID token for {self.user_id}"
+
+
+class SocialMediaAccount(models.Model):
+    """
+    Social media accounts linked to a user profile, one per platform
+    """
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='social_media_accounts')
+    platform = models.CharField(max_length=50, help_text='Lowercased platform name, e.g. twitter')
+    username = models.CharField(max_length=255)
+    url = models.URLField(max_length=500, blank=True)
+    added_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'social_media_accounts'
+        unique_together = [['user', 'platform']]
+        indexes = [
+            models.Index(fields=['platform', 'username']),
+        ]
+
+    def __str__(self):
+        return f"{self.platform}: {self.username}"
+
+
 class Institution(models.Model):
     """
     Research institutions and organizations
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=500)
     short_name = models.CharField(max_length=100, blank=True)
     country = models.CharField(max_length=100)
@@ -104,10 +150,13 @@ class Institution(models.Model):
     class Meta:
         db_table = 'institutions'
         indexes = [
-            models.Index(fields=['name']),
             models.Index(fields=['country']),
             models.Index(fields=['ror_id']),
         ]
+        constraints = [
+            # ORCID syncs match institutions by name; the unique index also serves name lookups
+            models.UniqueConstraint(fields=['name'], name='uniq_institution_name'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.country})"
@@ -127,8 +176,9 @@ class Affiliation(models.Model):
         ('service', 'Service'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='affiliations')
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    # user_id lookups use the (user, affiliation_type) index instead of a separate one
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='affiliations', db_index=False)
     institution = models.ForeignKey(Institution, on_delete=models.CASCADE, related_name='affiliations')
     
     affiliation_type = models.CharField(max_length=20, choices=AFFILIATION_TYPES)
@@ -158,8 +208,19 @@ class Affiliation(models.Model):
         db_table = 'affiliations'
         indexes = [
             models.Index(fields=['user', 'affiliation_type']),
-            models.Index(fields=['institution']),
-            models.Index(fields=['is_current']),
+            # Only current affiliations are filtered on; past ones stay out of the index
+            models.Index(fields=['is_current'], condition=models.Q(is_current=True), name='affil_current'),
+        ]
+        constraints = [
+            # Let ORCID syncs insert with ignore_conflicts instead of checking for duplicates first
+            models.UniqueConstraint(
+                fields=['user', 'institution', 'affiliation_type', 'start_date'], name='uniq_affil'
+            ),
+            models.UniqueConstraint(
+                fields=['user', 'orcid_put_code'],
+                condition=models.Q(orcid_put_code__gt=''),
+                name='uniq_affil_put',
+            ),
         ]
 
     def __str__(self):
@@ -184,8 +245,11 @@ class Work(models.Model):
         ('other', 'Other'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     title = models.TextField()
+    title_short = models.CharField(
+        max_length=103, editable=False, help_text='First 100 characters of the title, set on save'
+    )
     work_type = models.CharField(max_length=30, choices=WORK_TYPES)
     
     # Publication details
@@ -194,7 +258,7 @@ class Work(models.Model):
     publication_year = models.IntegerField(null=True, blank=True)
     
     # External identifiers
-    doi = models.CharField(max_length=200, blank=True, unique=True, null=True)
+    doi = models.CharField(max_length=200, blank=True, null=True, help_text='Stored lowercased')
     pmid = models.CharField(max_length=20, blank=True, help_text='PubMed ID')
     isbn = models.CharField(max_length=20, blank=True)
     issn = models.CharField(max_length=20, blank=True)
@@ -202,7 +266,6 @@ class Work(models.Model):
     
     # Content
     abstract = models.TextField(blank=True)
-    keywords = models.JSONField(default=list, blank=True)
     language = models.CharField(max_length=10, default='en')
     
     # URLs
@@ -236,18 +299,39 @@ class Work(models.Model):
             models.Index(fields=['work_type']),
             models.Index(fields=['citation_count']),
         ]
+        constraints = [
+            # DOIs are case-insensitive, so uniqueness is enforced on the lowercased value
+            models.UniqueConstraint(Lower('doi'), name='works_doi_lower_uniq'),
+        ]
 
     def __str__(self):
-        return f"{self.title[:100]}{'...' if len(self.title) > 100 else ''}"
+        return self.title_short
+
+    @staticmethod
+    def shorten_title(title):
+        return f"{title[:100]}{'...' if len(title) > 100 else ''}"
+
+    def save(self, *args, **kwargs):
+        # Normalized at write time so exact doi= lookups on the btree index match any casing
+        self.doi = self.doi.strip().lower() if self.doi else None
+        # Kept alongside the title so listings never read the full (possibly TOASTed) text
+        self.title_short = self.shorten_title(self.title)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'title' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'title_short'}
+        super().save(*args, **kwargs)
 
 
 class WorkAuthor(models.Model):
     """
     Authors associated with works (many-to-many relationship with additional data)
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    work = models.ForeignKey(Work, on_delete=models.CASCADE, related_name='authors')
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='authored_works', null=True, blank=True)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    # Both foreign keys are served by the composite indexes below rather than their own
+    work = models.ForeignKey(Work, on_delete=models.CASCADE, related_name='authors', db_index=False)
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='authored_works', null=True, blank=True, db_index=False
+    )
     
     # Author information (for non-registered users)
     name = models.CharField(max_length=500)
@@ -264,17 +348,44 @@ class WorkAuthor(models.Model):
 
     class Meta:
         db_table = 'work_authors'
+        # The unique index on (work, author_order) also serves work_id lookups
         unique_together = [['work', 'author_order']]
         indexes = [
-            models.Index(fields=['work', 'author_order']),
-            models.Index(fields=['user']),
-            models.Index(fields=['orcid_id']),
+            # Most authors are not registered users, so rows with no ORCID iD
+            # are left out of this index
+            models.Index(fields=['orcid_id'], condition=models.Q(orcid_id__gt=''), name='wa_orcid_nn'),
+        ]
+        constraints = [
+            # A user is listed once per work; rows with no user are left out, and
+            # the index also serves a user's works
+            models.UniqueConstraint(
+                fields=['user', 'work'], condition=models.Q(user__isnull=False), name='uniq_work_author_user'
+            ),
         ]
 
     def __str__(self):
         return f"{self.name} - {self.work.title[:50]}"
 
 
+class WorkKeyword(models.Model):
+    """
+    Keywords tagged on a work
+    """
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    work = models.ForeignKey(Work, on_delete=models.CASCADE, related_name='keywords')
+    keyword = models.CharField(max_length=200)
+
+    class Meta:
+        db_table = 'work_keywords'
+        unique_together = [['work', 'keyword']]
+        indexes = [
+            models.Index(fields=['keyword']),
+        ]
+
+    def __str__(self):
+        return self.keyword
+
+
 class Funding(models.Model):
     """
     Research funding and grants
@@ -288,7 +399,7 @@ class Funding(models.Model):
         ('other', 'Other'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='funding')
     
     title = models.CharField(max_length=500)
@@ -331,6 +442,13 @@ class Funding(models.Model):
             models.Index(fields=['organization_name']),
             models.Index(fields=['start_date']),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'orcid_put_code'],
+                condition=models.Q(orcid_put_code__gt=''),
+                name='uniq_funding_put',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.organization_name}"
@@ -340,7 +458,7 @@ class ResearchArea(models.Model):
     """
     Research areas and fields of study
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=200, unique=True)
     description = models.TextField(blank=True)
     parent = models.ForeignKey('self', on_delete=models.CASCADE, null=True, blank=True, related_name='children')
@@ -366,7 +484,7 @@ class UserResearchArea(models.Model):
     """
     Research areas associated with users
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='research_areas')
     research_area = models.ForeignKey(ResearchArea, on_delete=models.CASCADE, related_name='users')
     is_primary = models.BooleanField(default=False)
@@ -384,7 +502,7 @@ class Citation(models.Model):
     """
     Citation relationships between works
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     citing_work = models.ForeignKey(Work, on_delete=models.CASCADE, related_name='citations_made')
     cited_work = models.ForeignKey(Work, on_delete=models.CASCADE, related_name='citations_received')
     
@@ -424,7 +542,7 @@ class UserMetrics(models.Model):
     """
     Cached research metrics for users
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='metrics')
     
     # Publication metrics
@@ -434,12 +552,10 @@ class UserMetrics(models.Model):
     i10_index = models.IntegerField(default=0)
     
     # Career metrics
-    years_active = models.IntegerField(default=0)
     first_publication_year = models.IntegerField(null=True, blank=True)
     last_publication_year = models.IntegerField(null=True, blank=True)
     
     # Impact metrics
-    avg_citations_per_paper = models.FloatField(default=0.0)
     max_citations_single_paper = models.IntegerField(default=0)
     
     # Collaboration metrics
@@ -457,12 +573,24 @@ class UserMetrics(models.Model):
     def __str__(self):
         return f"Metrics for {self.user.username}: {self.total_publications} pubs, {self.total_citations} cites, h={self.h_index}"
 
+    # Derived metrics: computed from the stored counts rather than kept as columns
+
+    @property
+    def years_active(self):
+        if self.first_publication_year and self.last_publication_year:
+            return self.last_publication_year - self.first_publication_year + 1
+        return 0
+
+    @property
+    def avg_citations_per_paper(self):
+        return self.total_citations / self.total_publications if self.total_publications else 0.0
+
 
 class CollaborationNetwork(models.Model):
     """
     Research collaboration networks between users
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user1 = models.ForeignKey(User, on_delete=models.CASCADE, related_name='collaborations_as_user1')
     user2 = models.ForeignKey(User, on_delete=models.CASCADE, related_name='collaborations_as_user2')
     
@@ -471,9 +599,6 @@ class CollaborationNetwork(models.Model):
     first_collaboration_date = models.DateField()
     last_collaboration_date = models.DateField()
     
-    # Shared works
-    shared_works = models.ManyToManyField(Work, blank=True)
-    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -489,12 +614,21 @@ class CollaborationNetwork(models.Model):
     def __str__(self):
         return f"Collaboration: {self.user1.username} ↔ {self.user2.username} ({self.total_collaborations} works)"
 
+    @property
+    def shared_works(self):
+        """Works authored by both users, derived from WorkAuthor instead of a join table"""
+        return Work.objects.filter(
+            id__in=WorkAuthor.objects.filter(user_id=self.user1_id).values('work')
+        ).filter(
+            id__in=WorkAuthor.objects.filter(user_id=self.user2_id).values('work')
+        )
+
 
 class CitationTimeSeries(models.Model):
     """
     Simple temporal citation data tracking citations per year for users
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='citation_timeseries')
     year = models.IntegerField()
     citations_count = models.IntegerField(default=0, help_text='Number of citations received in this year')
@@ -518,7 +652,7 @@ class APIUsageLog(models.Model):
     """
     API usage tracking for rate limiting and analytics
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
     ip_address = models.GenericIPAddressField()
     
@@ -542,9 +676,48 @@ class APIUsageLog(models.Model):
         indexes = [
             models.Index(fields=['user', 'timestamp']),
             models.Index(fields=['ip_address', 'timestamp']),
-            models.Index(fields=['endpoint']),
-            models.Index(fields=['rate_limit_key', 'timestamp']),
+            models.Index(fields=['endpoint', 'timestamp']),
+            models.Index(fields=['-timestamp']),
+            # Rate-limit window checks only count requests that did not fail server-side
+            models.Index(
+                fields=['rate_limit_key', '-timestamp'],
+                name='apilog_ratelimit_recent',
+                condition=models.Q(status_code__lt=500),
+            ),
         ]
 
     def __str__(self):
-        return f"{self.method} {self.endpoint} - {self.status_code} ({self.timestamp})" 
\ No newline at end of file
+        return f"{self.method} {self.endpoint} - {self.status_code} ({self.timestamp})" 
+
+
+class CrossrefCitationCache(models.Model):
+    """
+    Cached CrossRef citation counts, keyed by lowercased DOI
+    """
+    doi = models.CharField(max_length=200, primary_key=True)
+    citation_count = models.IntegerField(default=0)
+    fetched_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'crossref_citation_cache'
+        indexes = [
+            models.Index(fields=['fetched_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.doi}: {self.citation_count} citations ({self.fetched_at})"
+
+
+class SeedVersion(models.Model):
+    """
+    Fingerprint of the seed data last applied by the setup_database command
+    """
+    name = models.CharField(max_length=100, primary_key=True)
+    fingerprint = models.CharField(max_length=64, help_text='SHA-256 of the seed data file')
+    applied_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'seed_versions'
+
+    def __str__(self):
+        return f"{self.name} ({self.fingerprint[:12]})"
@@ -0,0 +1,90 @@
+"""
+Monthly range partitions of api_usage_logs (PostgreSQL only)
+
+Migration 0018 turns api_usage_logs into a table partitioned by month on
+timestamp, plus a DEFAULT partition for rows outside every created month.
+The manage_api_usage_partitions command creates the coming months ahead of
+time and drops the months past the retention period, so old logs go with a
+DROP TABLE instead of a DELETE over the whole table.
+"""
+
+import datetime
+
+PARENT_TABLE = 'api_usage_logs'
+DEFAULT_PARTITION = 'api_usage_logs_default'
+
+
+def month_start(value):
+    """First instant (UTC) of the month containing value"""
+    value = value.astimezone(datetime.timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month, count):
+    years, month_index = divmod(month.month - 1 + count, 12)
+    return month.replace(year=month.year + years, month=month_index + 1)
+
+
+def partition_name(month):
+    return f'{PARENT_TABLE}_{month:%Y_%m}'
+
+
+def existing_partitions(cursor):
+    """Month partitions currently attached, as {month start: table name}"""
+    cursor.execute(
+        'SELECT child.relname FROM pg_inherits '
+        'JOIN pg_class parent ON parent.oid = pg_inherits.inhparent '
+        'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+        'WHERE parent.relname = %s',
+        [PARENT_TABLE],
+    )
+    partitions = {}
+    for (name,) in cursor.fetchall():
+        if name == DEFAULT_PARTITION:
+            continue
+        month = datetime.datetime.strptime(name[len(PARENT_TABLE) + 1:], '%Y_%m')
+        partitions[month.replace(tzinfo=datetime.timezone.utc)] = name
+    return partitions
+
+
+def create_month_partition(cursor, month):
+    """
+    Create and attach the partition of one month. Rows of that month already
+    in the DEFAULT partition are moved into it first, otherwise the attach fails
+    """
+    name = partition_name(month)
+    start, end = month, add_months(month, 1)
+    cursor.execute(f'CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    cursor.execute(
+        f'WITH moved AS (DELETE FROM {DEFAULT_PARTITION} '
+        f'WHERE "timestamp" >= %s AND "timestamp" < %s RETURNING *) '
+        f'INSERT INTO {name} SELECT * FROM moved',
+        [start, end],
+    )
+    cursor.execute(
+        f'ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} FOR VALUES FROM (%s) TO (%s)',
+        [start, end],
+    )
+    return name
+
+
+def ensure_partitions(cursor, first_month, last_month):
+    """Create the missing month partitions from first_month to last_month inclusive"""
+    existing = existing_partitions(cursor)
+    created = []
+    month, last_month = month_start(first_month), month_start(last_month)
+    while month <= last_month:
+        if month not in existing:
+            created.append(create_month_partition(cursor, month))
+        month = add_months(month, 1)
+    return created
+
+
+def drop_partitions_before(cursor, month):
+    """Drop every month partition older than month"""
+    dropped = []
+    for partition_month, name in sorted(existing_partitions(cursor).items()):
+        if partition_month < month:
+            cursor.execute(f'DROP TABLE {name}')
+            dropped.append(name)
+    return dropped
@@ -0,0 +1,19 @@
+"""
+Celery tasks for the ORCID Research Platform
+"""
+
+import requests
+from celery import shared_task
+from django.core.management import call_command
+
+
+@shared_task(
+    bind=True,
+    rate_limit='10/s',
+    autoretry_for=(requests.RequestException,),
+    retry_backoff=True,
+    max_retries=5,
+)
+def populate_user_with_citations_task(self, orcid_id, **options):
+    """Populate one user from ORCID on a worker; see the populate_user_with_citations command."""
+    call_command('populate_user_with_citations', orcid_id=orcid_id, **options)
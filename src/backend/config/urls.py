@@ -15,7 +15,7 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path
 from oauth.oauth_views import (
     oauth_authorize, oauth_callback, oauth_status, 
     get_user_identity, get_current_user_identity, 
@@ -26,29 +26,34 @@ from oauth.oauth_views import (
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    # Grouped by prefix, so the resolver only walks the patterns under the matching one
     # OAuth endpoints
-    path('oauth/authorize/', oauth_authorize, name='oauth_authorize'),
-    path('oauth/callback/', oauth_callback, name='oauth_callback'),
-    path('oauth/status/', oauth_status, name='oauth_status'),
-    # User identity endpoints
-    path('api/user-identity/', get_user_identity, name='get_user_identity'),
-    path('api/current-user-identity/', get_current_user_identity, name='get_current_user_identity'),
-    # Citation analysis endpoints
-    path('api/citation-metrics/', get_citation_metrics, name='get_citation_metrics'),
-    path('api/citation-analysis/', get_citation_analysis, name='get_citation_analysis'),
-    path('api/test-citation-analysis/', test_citation_analysis, name='test_citation_analysis'),
-    path('api/quick-citation-test/', quick_citation_test, name='quick_citation_test'),
-    # Search endpoints
-    path('api/search-researchers/', search_researchers, name='search_researchers'),
-    # Papers/Publications endpoints
-    path('api/researcher-papers/', get_researcher_papers, name='get_researcher_papers'),
-    # Social media endpoints
-    path('api/add-social-media/', add_social_media_account, name='add_social_media_account'),
-    path('api/get-social-media/', get_social_media_accounts, name='get_social_media_accounts'),
-    # Debug endpoint
-    path('api/debug-session/', debug_session, name='debug_session'),
-    # Health check endpoint
-    path('api/health/', health_check, name='health_check'),
-    # Simple test endpoint
-    path('api/simple-test/', simple_test, name='simple_test'),
+    path('oauth/', include([
+        path('authorize/', oauth_authorize, name='oauth_authorize'),
+        path('callback/', oauth_callback, name='oauth_callback'),
+        path('status/', oauth_status, name='oauth_status'),
+    ])),
+    path('api/', include([
+        # User identity endpoints
+        path('user-identity/', get_user_identity, name='get_user_identity'),
+        path('current-user-identity/', get_current_user_identity, name='get_current_user_identity'),
+        # Citation analysis endpoints
+        path('citation-metrics/', get_citation_metrics, name='get_citation_metrics'),
+        path('citation-analysis/', get_citation_analysis, name='get_citation_analysis'),
+        path('test-citation-analysis/', test_citation_analysis, name='test_citation_analysis'),
+        path('quick-citation-test/', quick_citation_test, name='quick_citation_test'),
+        # Search endpoints
+        path('search-researchers/', search_researchers, name='search_researchers'),
+        # Papers/Publications endpoints
+        path('researcher-papers/', get_researcher_papers, name='get_researcher_papers'),
+        # Social media endpoints
+        path('add-social-media/', add_social_media_account, name='add_social_media_account'),
+        path('get-social-media/', get_social_media_accounts, name='get_social_media_accounts'),
+        # Debug endpoint
+        path('debug-session/', debug_session, name='debug_session'),
+        # Health check endpoint
+        path('health/', health_check, name='health_check'),
+        # Simple test endpoint
+        path('simple-test/', simple_test, name='simple_test'),
+    ])),
 ]
@@ -5,10 +5,55 @@ This module provides helper functions for interacting with the CrossRef API
 to retrieve comprehensive publication metadata using DOIs.
 """
 
+import asyncio
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from typing import Dict, List, Optional, Union
 import urllib3
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _build_session() -> requests.Session:
+    """
+    Create an HTTP session with a keep-alive connection pool and retries.
+    
+    Transient CrossRef failures (rate limiting, 5xx) are retried with
+    exponential backoff before the error reaches the caller.
+    
+    Returns:
+        Configured requests Session
+    """
+    session = requests.Session()
+    retries = Retry(total=5, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared by every client so connections to CrossRef are reused across requests
+_session = _build_session()
+
+# Citation counts change slowly: cached counts are reused for 90 days
+CITATION_CACHE_TTL = timedelta(days=90)
+
+
+def _parse_json(response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 class PublicationAPIClient:
@@ -26,6 +71,7 @@ class PublicationAPIClient:
             'Accept': 'application/json',
             'User-Agent': user_agent or 'ORCID-Project/1.0 (mailto:your-email@example.com)'
         }
+        self.session = _session
     
     def _make_request(self, url, params=None, timeout=10):
         """
@@ -40,20 +86,20 @@ class PublicationAPIClient:
             Response JSON data
         """
         try:
-            response = requests.get(url, headers=self.headers, params=params, verify=True, timeout=timeout)
+            response = self.session.get(url, headers=self.headers, params=params, verify=True, timeout=timeout)
             response.raise_for_status()
-            return response.json()
+            return _parse_json(response)
         except requests.exceptions.Timeout:
             raise requests.RequestException(f"Request timeout after {timeout} seconds")
         except requests.exceptions.SSLError:
             # If SSL verification fails, try without verification (for testing environments)
             # Disable SSL warnings for this request
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            response = requests.get(url, headers=self.headers, params=params, verify=False, timeout=timeout)
+            response = self.session.get(url, headers=self.headers, params=params, verify=False, timeout=timeout)
             response.raise_for_status()
-            return response.json()
+            return _parse_json(response)
         except requests.exceptions.RequestException as e:
-            raise requests.RequestException(f"API request failed: {str(e)}")
+            raise requests.RequestException(f"API request failed: {str(e)}", response=e.response)
     
     def get_publication_by_doi(self, doi: str, timeout: int = 10) -> Dict:
         """
@@ -369,6 +415,210 @@ class PublicationAPIClient:
             'failed_count': len(failed)
         }
     
+    def fetch_many(self, dois: List[str], timeout: int = 10, max_workers: int = 8,
+                   deadline: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Get raw CrossRef metadata for several DOIs concurrently.
+        
+        Runs fetch_many_async on its own event loop; when called from code that
+        is already inside a running loop, falls back to a thread pool.
+        
+        Args:
+            dois: List of DOIs to retrieve
+            timeout: Request timeout in seconds for each DOI (default: 10)
+            max_workers: Maximum number of concurrent requests (default: 8)
+            deadline: Seconds allowed for the whole batch; DOIs still pending
+                by then are left out (default: no limit)
+            
+        Returns:
+            Dictionary mapping each DOI that was found to its metadata;
+            DOIs that fail to resolve are left out
+        """
+        if not dois:
+            return {}
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.fetch_many_async(
+                dois, timeout=timeout, max_concurrency=max_workers, deadline=deadline
+            ))
+        
+        def fetch(doi):
+            try:
+                return doi, self.get_publication_by_doi(doi, timeout=timeout)
+            except (ValueError, requests.RequestException):
+                return doi, None
+        
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(dois)))
+        futures = [executor.submit(fetch, doi) for doi in dois]
+        done, _ = wait(futures, timeout=deadline)
+        # Requests still running past the deadline finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+        
+        results = (future.result() for future in done)
+        return {doi: data for doi, data in results if data is not None}
+    
+    async def fetch_many_async(self, dois: List[str], timeout: int = 10, max_concurrency: int = 20,
+                               deadline: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Get raw CrossRef metadata for several DOIs on a single event loop.
+        
+        Args:
+            dois: List of DOIs to retrieve (with or without doi: prefix)
+            timeout: Request timeout in seconds for each DOI (default: 10)
+            max_concurrency: Maximum number of requests in flight (default: 20,
+                well under CrossRef's 50 requests per second limit)
+            deadline: Seconds allowed for the whole batch; DOIs still pending
+                by then are cancelled and left out (default: no limit)
+            
+        Returns:
+            Dictionary mapping each DOI that was found to its metadata;
+            DOIs that fail to resolve are left out
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+        
+        async with httpx.AsyncClient(headers=self.headers, limits=limits, timeout=timeout) as client:
+            async def fetch(doi):
+                clean_doi = doi.replace('doi:', '', 1) if doi.startswith('doi:') else doi
+                async with semaphore:
+                    try:
+                        response = await client.get(f"{self.base_url}/works/{clean_doi}")
+                        response.raise_for_status()
+                        # A non-JSON or truncated body only loses this DOI, not the batch
+                        return doi, _parse_json(response).get('message', {})
+                    except (httpx.HTTPError, ValueError):
+                        return doi, None
+            
+            tasks = [asyncio.ensure_future(fetch(doi)) for doi in dois]
+            done, pending = await asyncio.wait(tasks, timeout=deadline)
+            for task in pending:
+                task.cancel()
+            results = [task.result() for task in done]
+        
+        return {doi: data for doi, data in results if data is not None}
+    
+    def fetch_many_by_doi(self, dois: List[str], chunk: int = 40, timeout: int = 10) -> Dict[str, Dict]:
+        """
+        Get raw CrossRef metadata for several DOIs using the batch works filter.
+        
+        DOIs are sent in chunks as ``filter=doi:a,doi:b,...``, so a whole chunk
+        costs one request instead of one request per DOI. If CrossRef rejects a
+        chunk as too long (HTTP 414), the chunk size is halved and retried.
+        
+        Args:
+            dois: List of DOIs to retrieve (with or without doi: prefix)
+            chunk: Maximum number of DOIs per request (default: 40)
+            timeout: Request timeout in seconds for each request (default: 10)
+            
+        Returns:
+            Dictionary mapping each lowercased DOI that was found to its metadata;
+            DOIs unknown to CrossRef are left out
+            
+        Raises:
+            requests.RequestException: If a batch request fails
+        """
+        clean_dois = list(dict.fromkeys(
+            doi.replace('doi:', '', 1) if doi.startswith('doi:') else doi
+            for doi in dois if doi
+        ))
+        url = f"{self.base_url}/works"
+        results = {}
+        start = 0
+        
+        while start < len(clean_dois):
+            batch = clean_dois[start:start + chunk]
+            # A DOI matches at most one work, so rows=len(batch) fits the whole chunk in one page
+            params = {
+                'filter': ','.join(f'doi:{doi}' for doi in batch),
+                'rows': len(batch),
+            }
+            
+            try:
+                data = self._make_request(url, params=params, timeout=timeout)
+            except requests.RequestException as e:
+                if e.response is not None and e.response.status_code == 414 and chunk > 1:
+                    chunk //= 2
+                    continue
+                raise
+            
+            for item in data.get('message', {}).get('items', []):
+                results[item['DOI'].lower()] = item
+            start += len(batch)
+        
+        return results
+    
+    def get_citation_counts(self, dois: List[str], timeout: int = 10) -> Dict[str, int]:
+        """
+        Get CrossRef citation counts for several DOIs, reusing cached counts.
+        
+        Counts fetched within CITATION_CACHE_TTL are read from the
+        CrossrefCitationCache table; only the remaining DOIs are requested,
+        through the batch works filter, and written back to the cache.
+        
+        Args:
+            dois: List of DOIs (with or without doi: prefix)
+            timeout: Request timeout in seconds for each batch request (default: 10)
+            
+        Returns:
+            Dictionary mapping each lowercased DOI that was found to its citation count
+            
+        Raises:
+            requests.RequestException: If a batch request fails
+        """
+        clean_dois = list(dict.fromkeys(
+            (doi.replace('doi:', '', 1) if doi.startswith('doi:') else doi).lower()
+            for doi in dois if doi
+        ))
+        
+        # The cache lives in the Django database; outside Django just fetch
+        if not settings.configured:
+            fetched = self.fetch_many_by_doi(clean_dois, timeout=timeout)
+            return {doi: item.get('is-referenced-by-count', 0) for doi, item in fetched.items()}
+        
+        from config.models import CrossrefCitationCache
+        
+        cached = CrossrefCitationCache.objects.filter(
+            doi__in=clean_dois, fetched_at__gte=timezone.now() - CITATION_CACHE_TTL
+        ).in_bulk()
+        counts = {doi: entry.citation_count for doi, entry in cached.items()}
+        
+        missing = [doi for doi in clean_dois if doi not in cached]
+        if missing:
+            fetched = self.fetch_many_by_doi(missing, timeout=timeout)
+            counts.update(self.cache_citation_counts(
+                {doi: item.get('is-referenced-by-count', 0) for doi, item in fetched.items()}
+            ))
+        
+        return counts
+    
+    def cache_citation_counts(self, counts: Dict[str, int]) -> Dict[str, int]:
+        """
+        Write citation counts to the CrossrefCitationCache table.
+        
+        Args:
+            counts: Dictionary mapping DOIs to their citation count
+            
+        Returns:
+            The counts keyed by lowercased DOI, as stored
+        """
+        counts = {doi.lower(): count for doi, count in counts.items()}
+        if not counts or not settings.configured:
+            return counts
+        
+        from config.models import CrossrefCitationCache
+        
+        now = timezone.now()
+        # Stale rows are refreshed in the same statement
+        CrossrefCitationCache.objects.bulk_create(
+            [CrossrefCitationCache(doi=doi, citation_count=count, fetched_at=now) for doi, count in counts.items()],
+            update_conflicts=True,
+            unique_fields=['doi'],
+            update_fields=['citation_count', 'fetched_at'],
+        )
+        return counts
+    
     def get_journal_info(self, issn: str) -> Dict:
         """
         Get journal information by ISSN.
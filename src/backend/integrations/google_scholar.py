@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import functools
 import os
+import random
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Sequence
 
@@ -12,6 +16,32 @@ try:
 except ImportError:
     FreeProxy = None
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# Scholar lookups are full page scrapes, so formatted author data is kept on
+# disk and shared across processes; without diskcache every call scrapes
+CACHE_TTL = int(os.environ.get("SCHOLAR_CACHE_TTL", 24 * 60 * 60))
+# "No such author" is cached too, for less time, so a misspelled name is not
+# scraped on every call but a newly listed author shows up within the hour
+NEGATIVE_CACHE_TTL = int(os.environ.get("SCHOLAR_NEGATIVE_CACHE_TTL", 60 * 60))
+# Returned by a cached lookup when Scholar has no match; callers receive None.
+# A plain string so it survives the disk cache's pickling
+_NOT_FOUND = "__not_found__"
+_CACHE = (
+    diskcache.Cache(os.path.expanduser(os.environ.get("SCHOLAR_CACHE_DIR", "~/.cache/scholar_api")))
+    if diskcache is not None
+    else None
+)
+
+# In-process LRU in front of the disk cache, so the derived metric calls on
+# one author share a single lookup without unpickling it each time
+MEMORY_CACHE_SIZE = 256
+_memory: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+_memory_lock = threading.Lock()
+
 
 @dataclass(slots=True)
 class CitationData:
@@ -47,12 +77,105 @@ def _collect_proxies(max_proxies: int = 15) -> List[str]:
     return proxies
 
 
+def _is_transient(exc: Exception) -> bool:
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status in (429, 503):
+        return True
+    if type(exc).__name__ == "MaxTriesExceededException":
+        return True
+    message = str(exc).lower()
+    return any(marker in message for marker in ("429", "503", "captcha"))
+
+
+def _retry(fn, *args, retries: int = 4, base: float = 1.0, **kw):
+    # Rate limits and captcha pages from Scholar clear up after a pause:
+    # back off 1s, 2s, 4s, 8s (plus jitter) before giving up
+    for attempt in range(retries + 1):
+        try:
+            return fn(*args, **kw)
+        except Exception as exc:
+            if attempt == retries or not _is_transient(exc):
+                raise
+            wait = base * 2 ** attempt + random.random()
+            print(f"Scholar request throttled ({exc}), retrying in {wait:.1f}s")
+            time.sleep(wait)
+
+
+def _norm(text: str | None) -> str:
+    return (text or "").lower().strip()
+
+
+def _memory_get(k: tuple):
+    with _memory_lock:
+        entry = _memory.get(k)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del _memory[k]
+            return None
+        _memory.move_to_end(k)
+        return entry[1]
+
+
+def _memory_set(k: tuple, value, ttl: int) -> None:
+    with _memory_lock:
+        _memory[k] = (time.monotonic() + ttl, value)
+        _memory.move_to_end(k)
+        while len(_memory) > MEMORY_CACHE_SIZE:
+            _memory.popitem(last=False)
+
+
+def _cached(key, ttl: int = CACHE_TTL):
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kw):
+            k = key(*args, **kw)
+            hit = _memory_get(k)
+            if hit is None and _CACHE is not None:
+                hit = _CACHE.get(k)
+                if hit is not None:
+                    _memory_set(k, hit, NEGATIVE_CACHE_TTL if hit == _NOT_FOUND else ttl)
+            if hit is not None:
+                return None if hit == _NOT_FOUND else hit
+            result = fn(*args, **kw)
+            # Failed lookups return None and are retried on the next call
+            if result is not None:
+                expire = NEGATIVE_CACHE_TTL if result == _NOT_FOUND else ttl
+                _memory_set(k, result, expire)
+                if _CACHE is not None:
+                    _CACHE.set(k, result, expire=expire)
+            return None if result == _NOT_FOUND else result
+        return wrapper
+    return decorator
+
+
 class GoogleScholarAPI:
     def __init__(self, delay: float = 1.0, use_proxy: bool = True) -> None:
         self.delay = max(delay, 0.0)
+        self._last_request_ts = 0.0
         self._proxies: List[Optional[str]] = _collect_proxies() if use_proxy else []
         self._proxies.append(None)
         self._idx = 0
+        # Guards the pacing timestamp and the proxy rotation. The proxy is set
+        # through os.environ, which is process-wide, so a request holds the lock
+        # from choosing its proxy until it returns
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def clear_cache(disk: bool = False) -> None:
+        with _memory_lock:
+            _memory.clear()
+        if disk and _CACHE is not None:
+            _CACHE.clear()
+
+    def _throttle(self) -> None:
+        # Keeps requests at least `delay` apart, counting time already spent
+        # since the last one; cache hits never get here, so they never wait
+        with self._lock:
+            wait = self.delay - (time.monotonic() - self._last_request_ts)
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request_ts = time.monotonic()
 
     def _set_proxy_env(self, proxy: Optional[str]) -> None:
         if proxy:
@@ -63,30 +186,43 @@ class GoogleScholarAPI:
             os.environ.pop("HTTPS_PROXY", None)
 
     def _run_rotating(self, fn, *args, **kw):
-        tried, total = 0, len(self._proxies)
-        while tried < total:
-            proxy = self._proxies[self._idx]
-            self._set_proxy_env(proxy)
-            try:
-                return fn(*args, **kw)
-            except Exception as exc:
-                if proxy is not None:
-                    print(f"Proxy {proxy} failed: {exc}")
-                    self._proxies.pop(self._idx)
-                    total -= 1
-                    if total == 0:
+        with self._lock:
+            tried, total = 0, len(self._proxies)
+            while tried < total:
+                proxy = self._proxies[self._idx]
+                self._set_proxy_env(proxy)
+                try:
+                    return fn(*args, **kw)
+                except Exception as exc:
+                    if proxy is not None:
+                        print(f"Proxy {proxy} failed: {exc}")
+                        self._proxies.pop(self._idx)
+                        total -= 1
+                        if total == 0:
+                            raise
+                        self._idx %= total
+                    else:
                         raise
-                    self._idx %= total
-                else:
-                    raise
-            tried += 1
-        raise RuntimeError("All proxies failed")
+                tried += 1
+            raise RuntimeError("All proxies failed")
 
+    @_cached(lambda self, name, aff=None, idx=0: ("author", _norm(name), _norm(aff), idx))
     def search_author(self, name: str, aff: str | None = None, idx: int = 0):
+        return self._lookup_author(name, aff, idx)
+
+    # The metric helpers only need counts and citations per year, so they are
+    # served from a cached summary without the (large) publication objects
+    @_cached(lambda self, name, aff=None: ("summary", _norm(name), _norm(aff)))
+    def _author_summary(self, name: str, aff: str | None = None):
+        data = self._lookup_author(name, aff)
+        return data if data is None or data == _NOT_FOUND else self._summarize(data)
+
+    def _lookup_author(self, name: str, aff: str | None = None, idx: int = 0):
         def core():
-            authors = gscholar.search_author(name)
+            self._throttle()
+            authors = _retry(gscholar.search_author, name)
             if not authors:
-                return None
+                return _NOT_FOUND
             if aff:
                 authors = [a for a in authors if aff.lower() in str(a.affiliation).lower()] or authors
             return self._fmt_author(authors[idx])
@@ -97,15 +233,20 @@ class GoogleScholarAPI:
             print(f"Error searching author: {e}")
             return None
 
+    @_cached(lambda self, scholar_id: ("sid", scholar_id))
     def get_author_by_id(self, scholar_id: str):
+        def core():
+            self._throttle()
+            return self._fmt_author(_retry(gscholar.get_author, scholar_id))
+
         try:
-            return self._run_rotating(lambda: self._fmt_author(gscholar.get_author(scholar_id)))
+            return self._run_rotating(core)
         except Exception as e:
             print(f"Error fetching author {scholar_id}: {e}")
             return None
 
     def get_author_metrics(self, name: str, aff: str | None = None):
-        data = self.search_author(name, aff)
+        data = self._author_summary(name, aff)
         if data is None:
             return None
         return AuthorMetrics(
@@ -115,38 +256,36 @@ class GoogleScholarAPI:
             h_index=data["h_index"],
             i10_index=data["i10_index"],
             citations_per_year=data["citations_per_year"],
-            publications_count=len(data.get("publications", [])),
+            publications_count=data["publications_count"],
         )
 
+    def _get_citations_map(self, n: str, aff: str | None = None) -> Optional[Dict[int, int]]:
+        d = self._author_summary(n, aff)
+        return None if d is None else d["citations_per_year"]
+
     def get_citations_by_year(self, n: str, y: int, aff: str | None = None):
-        d = self.search_author(n, aff)
-        return None if d is None else d["citations_per_year"].get(y, 0)
+        per_year = self._get_citations_map(n, aff)
+        return None if per_year is None else per_year.get(y, 0)
 
     def get_citations_for_years(self, n: str, yrs: Sequence[int], aff: str | None = None):
-        d = self.search_author(n, aff) or {}
-        per_year = d.get("citations_per_year", {})
+        per_year = self._get_citations_map(n, aff) or {}
         return {y: per_year.get(y, 0) for y in yrs}
 
     def get_cumulative_citations(self, n: str, yrs: Sequence[int], aff: str | None = None):
-        yrs = sorted(set(yrs))
-        yearly = self.get_citations_for_years(n, yrs, aff)
+        per_year = self._get_citations_map(n, aff) or {}
         tot = 0
         return [
-            CitationData(y, yearly.get(y, 0), (tot := tot + yearly.get(y, 0)))
-            for y in yrs
+            CitationData(y, per_year.get(y, 0), (tot := tot + per_year.get(y, 0)))
+            for y in sorted(set(yrs))
         ]
 
     def search_publications(self, n: str, limit: int = 20):
         a = self.search_author(n)
         if a is None:
             return []
-        pubs = a.get("publications", [])[:limit]
-        out = []
-        for i, p in enumerate(pubs):
-            if i:
-                time.sleep(self.delay)
-            out.append(self._fmt_pub(p))
-        return out
+        # The publications come with the author lookup; formatting them makes
+        # no further requests, so there is nothing to pace or fan out
+        return [self._fmt_pub(p) for p in a.get("publications", [])[:limit]]
 
     @staticmethod
     def _fmt_author(a):
@@ -163,6 +302,12 @@ class GoogleScholarAPI:
             "interests": getattr(a, "interests", []) or [],
         }
 
+    @staticmethod
+    def _summarize(author: dict) -> dict:
+        summary = {k: v for k, v in author.items() if k != "publications"}
+        summary["publications_count"] = len(author["publications"])
+        return summary
+
     @staticmethod
     def _fmt_pub(p):
         bib = getattr(p, "bib", {})
@@ -177,9 +322,16 @@ class GoogleScholarAPI:
         }
 
 
+_api_lock = threading.Lock()
+
+
 def _api():
+    # Built once: the constructor probes free proxies over the network, so
+    # concurrent first calls wait on the lock instead of each probing
     if not hasattr(_api, "_inst"):
-        _api._inst = GoogleScholarAPI()
+        with _api_lock:
+            if not hasattr(_api, "_inst"):
+                _api._inst = GoogleScholarAPI()
     return _api._inst
 
 
@@ -7,20 +7,58 @@ publication metadata retrieval by DOI.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from typing import Dict, List, Optional, Union
 from decouple import config
+from django.conf import settings
+from django.core.cache import cache
 import urllib3
 from datetime import datetime
 from collections import defaultdict
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _build_session(pool_size: int = 8) -> requests.Session:
+    """
+    Create an HTTP session with a keep-alive connection pool.
+    
+    Args:
+        pool_size: Maximum number of pooled connections per host
+        
+    Returns:
+        Configured requests Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared by every client so connections to the ORCID API are reused across requests
+_session = _build_session()
+
+# Public ORCID records change rarely: section responses are cached for a day
+CACHE_TTL_SECONDS = 86400
+
+
+def _parse_json(response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 class ORCIDAPIClient:
     """Client for interacting with ORCID Public API, instantiated with a given access token or orcid_id """
     
-    def __init__(self,  orcid_id: str, base_url: str = None, access_token: str = ""):
+    def __init__(self,  orcid_id: str, base_url: str = None, access_token: str = "", use_cache: bool = False):
         """
         Initialize ORCID API client.
         
@@ -28,6 +66,7 @@ class ORCIDAPIClient:
             access_token: Valid ORCID access token (can be empty for public API calls)
             orcid_id: ORCID identifier (mandatory)
             base_url: ORCID base URL (defaults to config value)
+            use_cache: Cache public record sections in the Django cache (default False)
         """
         if not orcid_id:
             raise ValueError("ORCID ID is required")
@@ -47,6 +86,49 @@ class ORCIDAPIClient:
         self.headers = {'Accept': 'application/json'}
         if self.access_token:
             self.headers['Authorization'] = f'Bearer {self.access_token}'
+        
+        self.session = _session
+        # Authenticated responses may include limited-visibility items, so only
+        # public lookups are shared through the cache
+        self.use_cache = use_cache and not self.access_token
+    
+    def _cached(self, key, fn, ttl=CACHE_TTL_SECONDS):
+        """
+        Return the cached value for key, calling fn and caching its result on a miss.
+        
+        Args:
+            key: Cache key
+            fn: Callable producing the value
+            ttl: Time to live in seconds (default one day)
+            
+        Returns:
+            Cached or freshly computed value
+        """
+        if not self.use_cache or not settings.configured:
+            return fn()
+        value = cache.get(key)
+        if value is None:
+            value = fn()
+            cache.set(key, value, ttl)
+        return value
+    
+    def _get_record_section(self, section: str = '') -> Dict:
+        """
+        Get a section of the researcher's public record, going through the cache.
+        
+        Args:
+            section: Record section path (e.g. 'works'); empty for the full record
+            
+        Returns:
+            Section data dictionary
+        """
+        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
+        url = f"{self.api_base_url}/{clean_orcid_id}"
+        if section:
+            url = f"{url}/{section}"
+        key = f"orcid:{clean_orcid_id}:{section or 'record'}"
+        
+        return self._cached(key, lambda: self._make_request(url))
     
     def _make_request(self, url, params=None):
         """
@@ -60,17 +142,17 @@ class ORCIDAPIClient:
             Response JSON data
         """
         try:
-            response = requests.get(url, headers=self.headers, params=params, verify=True)
+            response = self.session.get(url, headers=self.headers, params=params, verify=True)
             response.raise_for_status()
-            return response.json()
+            return _parse_json(response)
         except requests.exceptions.SSLError:
             # If SSL verification fails, try without verification (for testing environments)
             print("⚠️  SSL verification failed, retrying without verification...")
             # Disable SSL warnings for this request
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            response = requests.get(url, headers=self.headers, params=params, verify=False)
+            response = self.session.get(url, headers=self.headers, params=params, verify=False)
             response.raise_for_status()
-            return response.json()
+            return _parse_json(response)
     
     def search_researchers(self, query: str, rows: int = 50, start: int = 0) -> Dict:
         """
@@ -103,10 +185,7 @@ class ORCIDAPIClient:
         Returns:
             Complete ORCID record dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}"
-        
-        return self._make_request(url)
+        return self._get_record_section()
     
     def get_researcher_person_info(self) -> Dict:
         """
@@ -115,10 +194,7 @@ class ORCIDAPIClient:
         Returns:
             Person information dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/person"
-        
-        return self._make_request(url)
+        return self._get_record_section('person')
     
     def get_researcher_works(self) -> Dict:
         """
@@ -127,10 +203,7 @@ class ORCIDAPIClient:
         Returns:
             Works summary dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/works"
-        
-        return self._make_request(url)
+        return self._get_record_section('works')
     
     def get_researcher_employments(self) -> Dict:
         """
@@ -139,10 +212,7 @@ class ORCIDAPIClient:
         Returns:
             Employment history dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/employments"
-        
-        return self._make_request(url)
+        return self._get_record_section('employments')
     
     def get_researcher_education(self) -> Dict:
         """
@@ -151,10 +221,7 @@ class ORCIDAPIClient:
         Returns:
             Education history dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/educations"
-        
-        return self._make_request(url)
+        return self._get_record_section('educations')
     
     def get_researcher_funding(self) -> Dict:
         """
@@ -163,10 +230,7 @@ class ORCIDAPIClient:
         Returns:
             Funding information dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/fundings"
-        
-        return self._make_request(url)
+        return self._get_record_section('fundings')
     
     def get_researcher_activities(self) -> Dict:
         """
@@ -175,10 +239,7 @@ class ORCIDAPIClient:
         Returns:
             Activities summary dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/activities"
-        
-        return self._make_request(url)
+        return self._get_record_section('activities')
     
     def get_researcher_peer_reviews(self) -> Dict:
         """
@@ -187,10 +248,7 @@ class ORCIDAPIClient:
         Returns:
             Peer reviews dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/peer-reviews"
-        
-        return self._make_request(url)
+        return self._get_record_section('peer-reviews')
     
     def get_researcher_research_resources(self) -> Dict:
         """
@@ -199,10 +257,7 @@ class ORCIDAPIClient:
         Returns:
             Research resources dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/research-resources"
-        
-        return self._make_request(url)
+        return self._get_record_section('research-resources')
     
     def get_researcher_distinctions(self) -> Dict:
         """
@@ -211,10 +266,7 @@ class ORCIDAPIClient:
         Returns:
             Distinctions dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/distinctions"
-        
-        return self._make_request(url)
+        return self._get_record_section('distinctions')
     
     def get_researcher_invited_positions(self) -> Dict:
         """
@@ -223,10 +275,7 @@ class ORCIDAPIClient:
         Returns:
             Invited positions dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/invited-positions"
-        
-        return self._make_request(url)
+        return self._get_record_section('invited-positions')
     
     def get_researcher_memberships(self) -> Dict:
         """
@@ -235,10 +284,7 @@ class ORCIDAPIClient:
         Returns:
             Memberships dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/memberships"
-        
-        return self._make_request(url)
+        return self._get_record_section('memberships')
     
     def get_researcher_services(self) -> Dict:
         """
@@ -247,10 +293,7 @@ class ORCIDAPIClient:
         Returns:
             Services dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/services"
-        
-        return self._make_request(url)
+        return self._get_record_section('services')
     
     def get_researcher_qualifications(self) -> Dict:
         """
@@ -259,10 +302,7 @@ class ORCIDAPIClient:
         Returns:
             Qualifications dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/qualifications"
-        
-        return self._make_request(url)
+        return self._get_record_section('qualifications')
     
     def _clean_orcid_id(self, orcid_id: str) -> str:
         """
@@ -637,10 +677,7 @@ class ORCIDAPIClient:
         Returns:
             Personal details dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/personal-details"
-        
-        return self._make_request(url)
+        return self._get_record_section('personal-details')
     
     def get_emails(self) -> Dict:
         """
@@ -649,10 +686,7 @@ class ORCIDAPIClient:
         Returns:
             Email addresses dictionary
         """
-        clean_orcid_id = self._clean_orcid_id(self.orcid_id)
-        url = f"{self.api_base_url}/{clean_orcid_id}/emails"
-        
-        return self._make_request(url)
+        return self._get_record_section('emails')
     
     def get_user_identity_info(self) -> Dict:
         """
@@ -821,64 +855,49 @@ class ORCIDAPIClient:
                 publications_with_dois = publications_with_dois[:max_publications]
                 print(f"📚 Limited to {max_publications} most recent publications")
             
-            # Parallel citation lookup function
-            def get_citation_count(pub):
-                """Get citation count for a single publication"""
-                try:
-                    citation_info = crossref_client.get_publication_citations(pub['doi'], timeout=timeout_per_request)
-                    return {
-                        'pub': pub,
-                        'citation_count': citation_info.get('citation_count', 0),
-                        'success': True,
-                        'error': None
-                    }
-                except Exception as e:
-                    return {
-                        'pub': pub,
-                        'citation_count': 0,
-                        'success': False,
-                        'error': str(e)
-                    }
-            
-            # Process publications in parallel
+            # Batch prefetch: cached counts first, then one CrossRef request per chunk of DOIs
+            try:
+                cached_counts = crossref_client.get_citation_counts(
+                    [pub['doi'] for pub in publications_with_dois], timeout=timeout_per_request
+                )
+            except Exception as e:
+                print(f"⚠️  Batch CrossRef lookup failed, falling back to per-DOI lookups: {e}")
+                cached_counts = {}
+            
+            # DOIs the batch could not resolve are looked up one by one, concurrently,
+            # within what is left of the analysis time, and cached like the batch results
+            missing_dois = [pub['doi'] for pub in publications_with_dois if pub['doi'].lower() not in cached_counts]
+            remaining_time = max_analysis_time - (time.time() - analysis_start_time)
+            if missing_dois and remaining_time > 0:
+                fetched = crossref_client.fetch_many(
+                    missing_dois, timeout=timeout_per_request, max_workers=10, deadline=remaining_time
+                )
+                cached_counts.update(crossref_client.cache_citation_counts(
+                    {doi: metadata.get('is-referenced-by-count', 0) for doi, metadata in fetched.items()}
+                ))
+            
             citations_by_year = defaultdict(int)
             total_citations = 0
             publications_with_citations = 0
             successful_lookups = 0
             failed_lookups = 0
             
-            # Use ThreadPoolExecutor for parallel API calls
-            max_workers = min(10, len(publications_with_dois))  # Limit concurrent requests
-            
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all citation lookup tasks
-                future_to_pub = {executor.submit(get_citation_count, pub): pub for pub in publications_with_dois}
+            for pub in publications_with_dois:
+                citation_count = cached_counts.get(pub['doi'].lower())
+                if citation_count is None:
+                    failed_lookups += 1
+                    continue
                 
-                # Process completed requests
-                for future in as_completed(future_to_pub, timeout=max_analysis_time - (time.time() - analysis_start_time)):
-                    try:
-                        result = future.result()
-                        pub = result['pub']
-                        
-                        if result['success']:
-                            successful_lookups += 1
-                            citation_count = result['citation_count']
-                            
-                            if citation_count > 0:
-                                publications_with_citations += 1
-                                total_citations += citation_count
-                                
-                                # Attribute ALL citations to publication year (regardless of start_year)
-                                # The start_year only affects what we display, not what we count
-                                pub_year = pub['publication_year']
-                                if pub_year:
-                                    citations_by_year[pub_year] += citation_count
-                        else:
-                            failed_lookups += 1
-                            
-                    except Exception as e:
-                        failed_lookups += 1
-                        continue
+                successful_lookups += 1
+                if citation_count > 0:
+                    publications_with_citations += 1
+                    total_citations += citation_count
+                    
+                    # Attribute ALL citations to publication year (regardless of start_year)
+                    # The start_year only affects what we display, not what we count
+                    pub_year = pub['publication_year']
+                    if pub_year:
+                        citations_by_year[pub_year] += citation_count
             
             total_analysis_time = time.time() - analysis_start_time
             
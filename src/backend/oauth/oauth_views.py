@@ -11,7 +11,7 @@ import json
 import requests
 from django.views.decorators.csrf import csrf_exempt
 from django.db.models import Sum
-from config.models import User, CitationTimeSeries, Work
+from config.models import User, UserOrcidToken, SocialMediaAccount, CitationTimeSeries, Work
 from django.utils import timezone
 from datetime import datetime
 import concurrent.futures
@@ -138,8 +138,6 @@ def oauth_callback(request):
             orcid_id=orcid_id,
             defaults={
                 'username': user_identity.get('name', str(orcid_id)),  # Use ORCID ID as fallback username initially
-                'orcid_access_token': access_token,
-                'orcid_refresh_token': token_response.get('refresh_token', ''),
                 'display_name': user_identity.get('name', ''),
                 'email': email,
                 'last_orcid_sync': timezone.now()
@@ -147,9 +145,7 @@ def oauth_callback(request):
         )
         
         if not created:
-            # Update existing user with new token and info
-            user.orcid_access_token = access_token
-            user.orcid_refresh_token = token_response.get('refresh_token', '')
+            # Update existing user info
             user.last_orcid_sync = timezone.now()
             
             # Update display name and email if they're empty or different
@@ -168,6 +164,15 @@ def oauth_callback(request):
         else:
             logger.info(f"Created new user: {user.username} ({orcid_id})")
         
+        # Tokens live in their own table, keeping the users row narrow
+        UserOrcidToken.objects.update_or_create(
+            user=user,
+            defaults={
+                'access_token': access_token,
+                'refresh_token': token_response.get('refresh_token', ''),
+            }
+        )
+        
         # Log the user in
         login(request, user)
         
@@ -531,7 +536,7 @@ def get_current_user_identity(request):
         if request.user.is_authenticated and hasattr(request.user, 'orcid_id') and request.user.orcid_id:
             user = request.user
             orcid_id = user.orcid_id
-            access_token = user.orcid_access_token or ''
+            access_token = UserOrcidToken.objects.filter(user=user).values_list('access_token', flat=True).first() or ''
             
             logger.info(f"Using Django authenticated user: {user.username} ({orcid_id})")
             
@@ -1164,8 +1169,7 @@ def add_social_media_account(request):
                 username=template_username,
                 email=template_email,
                 orcid_id=orcid_id,
-                display_name=f"ORCID User {orcid_id}",
-                social_media_accounts=[]
+                display_name=f"ORCID User {orcid_id}"
             )
             user_created = True
             logger.info(f"Created new user with ORCID ID: {orcid_id}, username: {template_username}")
@@ -1188,36 +1192,19 @@ def add_social_media_account(request):
                 'supported_platforms': supported_platforms
             }, status=400)
         
-        # Create new social media account entry
-        new_account = {
-            'platform': platform.lower(),
-            'username': username,
-            'url': url,
-            'added_at': timezone.now().isoformat()
-        }
-        
-        # Get current social media accounts
-        current_accounts = user.social_media_accounts or []
-        
-        # Check if account already exists for this platform
-        existing_account_index = None
-        for i, account in enumerate(current_accounts):
-            if account.get('platform') == platform.lower():
-                existing_account_index = i
-                break
-        
-        if existing_account_index is not None:
-            # Update existing account
-            current_accounts[existing_account_index] = new_account
-            action = 'updated'
-        else:
-            # Add new account
-            current_accounts.append(new_account)
-            action = 'added'
+        # One account per platform: an existing one is replaced
+        _, account_created = SocialMediaAccount.objects.update_or_create(
+            user=user,
+            platform=platform.lower(),
+            defaults={
+                'username': username,
+                'url': url,
+                'added_at': timezone.now()
+            }
+        )
+        action = 'added' if account_created else 'updated'
         
-        # Update user's social media accounts
-        user.social_media_accounts = current_accounts
-        user.save()
+        current_accounts = _social_media_account_dicts(user.social_media_accounts.order_by('added_at'))
         
         logger.info(f"Successfully {action} {platform} account for user {user.username} (ORCID: {orcid_id})")
         
@@ -1246,6 +1233,27 @@ def add_social_media_account(request):
         }, status=500)
 
 
+def _social_media_account_dicts(accounts) -> list:
+    """
+    Serialize SocialMediaAccount rows to the JSON shape the API returns
+    
+    Args:
+        accounts: Iterable of SocialMediaAccount instances
+        
+    Returns:
+        List of dicts with platform, username, url and ISO-formatted added_at
+    """
+    return [
+        {
+            'platform': account.platform,
+            'username': account.username,
+            'url': account.url,
+            'added_at': account.added_at.isoformat()
+        }
+        for account in accounts
+    ]
+
+
 def _generate_social_media_url(platform: str, username: str) -> str:
     """
     Generate social media URL based on platform and username
@@ -1317,11 +1325,8 @@ def get_social_media_accounts(request):
                 'suggestion': 'User may not have been created yet. Try adding a social media account first.'
             }, status=404)
         
-        # Get social media accounts
-        social_media_accounts = user.social_media_accounts or []
-        
-        # Sort accounts by platform name for consistent ordering
-        social_media_accounts.sort(key=lambda x: x.get('platform', ''))
+        # Get social media accounts, sorted by platform name for consistent ordering
+        social_media_accounts = _social_media_account_dicts(user.social_media_accounts.order_by('platform'))
         
         # Build response with user info and social media accounts
         response_data = {
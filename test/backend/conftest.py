@@ -0,0 +1,43 @@
+"""
+pytest setup for the Django TestCase modules in this directory
+
+Puts src/backend on the path, fills in the settings the backend requires
+(a real environment or .env still wins) and runs the session against a
+throwaway test database, the way `manage.py test` would.
+"""
+
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'backend')
+sys.path.insert(0, os.path.abspath(BACKEND_DIR))
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# DEBUG selects the SQLite database, so no DATABASE_URL is needed
+for name, value in {
+    'SECRET_KEY': 'test-secret-key',
+    'DEBUG': 'True',
+    'ORCID_CLIENT_ID': 'test-client-id',
+    'ORCID_CLIENT_SECRET': 'test-client-secret',
+    'ORCID_REDIRECT_URI': 'http://localhost:8000/',
+}.items():
+    os.environ.setdefault(name, value)
+
+import django  # noqa: E402
+
+django.setup()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def django_test_database():
+    from django.test.runner import DiscoverRunner
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    runner = DiscoverRunner(verbosity=0)
+    old_config = runner.setup_databases()
+    yield
+    runner.teardown_databases(old_config)
+    teardown_test_environment()
@@ -0,0 +1,244 @@
+import io
+
+from django.test import TestCase
+
+from config.management.commands.populate_user_with_citations import Command
+from config.models import (
+    Affiliation, CitationTimeSeries, Funding, Institution, User, UserMetrics, Work, WorkAuthor,
+)
+
+
+def work_summary(doi, title, year=2020):
+    return {
+        'title': {'title': {'value': title}},
+        'type': 'journal-article',
+        'publication-date': {'year': {'value': str(year)}},
+        'external-ids': {'external-id': [{'external-id-type': 'doi', 'external-id-value': doi}]},
+        'put-code': 1,
+    }
+
+
+def works_data(*summaries):
+    return {'group': [{'work-summary': [summary]} for summary in summaries]}
+
+
+def affiliation_summary(org, start_year, role, put_code, country='BR', city=''):
+    return {
+        'organization': {'name': org, 'address': {'country': country, 'city': city}},
+        'role-title': role,
+        'department-name': '',
+        'start-date': {'year': {'value': str(start_year)}},
+        'end-date': None,
+        'put-code': put_code,
+    }
+
+
+def affiliations_data(*summaries):
+    return {'affiliation-group': [{'summaries': [summary]} for summary in summaries]}
+
+
+def funding_summary(title, org, put_code, url=''):
+    return {
+        'title': {'title': {'value': title}},
+        'type': 'grant',
+        'organization': {'name': org, 'address': {'country': 'BR'}},
+        'start-date': {'year': {'value': '2020'}},
+        'url': {'value': url},
+        'put-code': put_code,
+    }
+
+
+def funding_data(*summaries):
+    return {'group': [{'funding-summary': [summary]} for summary in summaries]}
+
+
+class ProcessPublicationsTest(TestCase):
+    def setUp(self):
+        self.command = Command(stdout=io.StringIO())
+        self.user = User.objects.create(
+            username="alice",
+            email="alice@example.com",
+            orcid_id="0000-0001-2345-6789",
+            display_name="Alice",
+        )
+
+    def process(self, data):
+        return self.command._process_publications(
+            self.user, data, crossref_client=None, max_publications=10, skip_citations=True
+        )
+
+    def test_resync_updates_titles(self):
+        self.process(works_data(work_summary("10.1000/abc", "Old title")))
+
+        synced = self.process(works_data(work_summary("10.1000/abc", "New title")))
+
+        self.assertEqual(synced, 1)
+        work = Work.objects.get()
+        self.assertEqual(work.title, "New title")
+        self.assertEqual(work.title_short, "New title")
+        self.assertEqual(WorkAuthor.objects.filter(user=self.user).count(), 1)
+
+    def test_dois_are_deduped_case_insensitively(self):
+        synced = self.process(works_data(
+            work_summary("10.1000/ABC", "Upper case"),
+            work_summary("10.1000/abc", "Lower case"),
+        ))
+        self.assertEqual(synced, 1)
+
+        self.process(works_data(work_summary(" 10.1000/Abc ", "Mixed case")))
+
+        work = Work.objects.get()
+        self.assertEqual(work.doi, "10.1000/abc")
+        self.assertEqual(work.title, "Mixed case")
+        self.assertEqual(WorkAuthor.objects.filter(user=self.user).count(), 1)
+
+    def test_user_is_added_after_the_existing_authors_of_a_shared_work(self):
+        other = User.objects.create(username="carol", email="carol@example.com", orcid_id="0000-0003-4567-8901")
+        work = Work.objects.create(title="Shared", doi="10.1000/shared")
+        WorkAuthor.objects.create(work=work, user=other, name="Carol", author_order=1)
+
+        synced = self.process(works_data(work_summary("10.1000/shared", "Shared")))
+
+        self.assertEqual(synced, 1)
+        self.assertEqual(WorkAuthor.objects.get(work=work, user=self.user).author_order, 2)
+
+
+class CalculateUserMetricsTest(TestCase):
+    def setUp(self):
+        self.command = Command(stdout=io.StringIO())
+        self.user = User.objects.create(
+            username="bob",
+            email="bob@example.com",
+            orcid_id="0000-0002-3456-7890",
+        )
+
+    def add_works(self, citation_counts):
+        works = Work.objects.bulk_create([
+            Work(title=f"Paper {i}", doi=f"10.1000/{i}", publication_year=2020, citation_count=count)
+            for i, count in enumerate(citation_counts)
+        ])
+        WorkAuthor.objects.bulk_create([
+            WorkAuthor(work=work, user=self.user, name="Bob", author_order=1) for work in works
+        ])
+
+    def h_index(self):
+        self.command._calculate_user_metrics(self.user)
+        return UserMetrics.objects.get(user=self.user).h_index
+
+    def test_h_index(self):
+        self.add_works([10, 8, 5, 4, 3, 0])
+        self.assertEqual(self.h_index(), 4)
+
+    def test_h_index_ties(self):
+        self.add_works([3, 3, 3, 3])
+        self.assertEqual(self.h_index(), 3)
+
+    def test_h_index_without_citations(self):
+        self.add_works([0, 0])
+        self.assertEqual(self.h_index(), 0)
+
+    def test_h_index_without_works(self):
+        self.assertEqual(self.h_index(), 0)
+
+
+class ProcessAffiliationsTest(TestCase):
+    def setUp(self):
+        self.command = Command(stdout=io.StringIO())
+        self.user = User.objects.create(
+            username="dana",
+            email="dana@example.com",
+            orcid_id="0000-0004-5678-9012",
+        )
+
+    def test_institutions_are_created_once_and_reused(self):
+        Institution.objects.create(name="USP", country="BR")
+
+        synced = self.command._process_affiliations(self.user, affiliations_data(
+            affiliation_summary("USP", 2010, "Student", 1, city="São Paulo"),
+            affiliation_summary("MIT", 2015, "Postdoc", 2, country="US"),
+        ), 'employment')
+
+        self.assertEqual(synced, 2)
+        self.assertEqual(Institution.objects.count(), 2)
+        # A blank city on the stored institution is filled in from ORCID
+        self.assertEqual(Institution.objects.get(name="USP").city, "São Paulo")
+
+    def test_separate_stints_at_one_institution_stay_separate(self):
+        synced = self.command._process_affiliations(self.user, affiliations_data(
+            affiliation_summary("USP", 2010, "Student", 1),
+            affiliation_summary("USP", 2018, "Professor", 2),
+        ), 'employment')
+
+        self.assertEqual(synced, 2)
+        self.assertEqual(
+            sorted(Affiliation.objects.filter(user=self.user).values_list('title', flat=True)),
+            ["Professor", "Student"],
+        )
+
+    def test_resync_updates_affiliations(self):
+        self.command._process_affiliations(
+            self.user, affiliations_data(affiliation_summary("USP", 2010, "Student", 1)), 'employment'
+        )
+
+        synced = self.command._process_affiliations(
+            self.user, affiliations_data(affiliation_summary("USP", 2010, "Lecturer", 1)), 'employment'
+        )
+
+        self.assertEqual(synced, 1)
+        self.assertEqual(Affiliation.objects.get(user=self.user).title, "Lecturer")
+
+
+class ProcessFundingTest(TestCase):
+    def setUp(self):
+        self.command = Command(stdout=io.StringIO())
+        self.user = User.objects.create(
+            username="erin",
+            email="erin@example.com",
+            orcid_id="0000-0005-6789-0123",
+        )
+
+    def test_funding_is_created_once_per_title(self):
+        synced = self.command._process_funding(self.user, funding_data(
+            funding_summary("Grant A", "FAPESP", 1),
+            funding_summary("Grant A", "FAPESP", 1),
+            funding_summary("Grant B", "CNPq", 2),
+        ))
+
+        self.assertEqual(synced, 2)
+        self.assertEqual(Funding.objects.filter(user=self.user).count(), 2)
+
+    def test_resync_refreshes_changed_funding(self):
+        self.command._process_funding(self.user, funding_data(funding_summary("Grant A", "FAPESP", 1)))
+
+        synced = self.command._process_funding(self.user, funding_data(
+            funding_summary("Grant A", "FAPESP", 1, url="https://example.org/grant-a")
+        ))
+
+        self.assertEqual(synced, 1)
+        funding = Funding.objects.get(user=self.user)
+        self.assertEqual(funding.url, "https://example.org/grant-a")
+
+
+class StoreCitationAnalysisTest(TestCase):
+    def setUp(self):
+        self.command = Command(stdout=io.StringIO())
+        self.user = User.objects.create(
+            username="frank",
+            email="frank@example.com",
+            orcid_id="0000-0006-7890-1234",
+        )
+
+    def store(self, yearly):
+        self.command._store_citation_analysis(self.user, {
+            'yearly_data': [{'year': year, 'citations': citations} for year, citations in yearly]
+        })
+        return list(
+            CitationTimeSeries.objects.filter(user=self.user).order_by('year').values_list('year', 'citations_count')
+        )
+
+    def test_time_series_is_stored(self):
+        self.assertEqual(self.store([(2020, 4), (2021, 2)]), [(2020, 4), (2021, 2)])
+
+    def test_time_series_is_replaced_on_resync(self):
+        self.store([(2019, 1), (2020, 4)])
+        self.assertEqual(self.store([(2020, 5), (2021, 3)]), [(2020, 5), (2021, 3)])